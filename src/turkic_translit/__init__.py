@@ -18,8 +18,16 @@ where PyICU (and everything downstream) is still being installed.
 
 from __future__ import annotations
 
-from importlib.metadata import version
+__all__ = ["__version__"]
 
-__version__ = version("turkic-translit")
 
-__all__ = ["__version__"]
+def __getattr__(name: str) -> str:
+    # PEP 562: read the installed metadata only when ``__version__`` is asked
+    # for, so plain ``import turkic_translit`` does not scan sys.path.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("turkic-translit")
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,34 +10,19 @@ import time
 import unicodedata as ud
 import urllib.request
 import xml.etree.ElementTree as ET
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from functools import cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Optional, TypeVar
 
 import click
 import requests
 import yaml  # type: ignore # Requires types-PyYAML
-from typing_extensions import Never
 
 from ..logging_config import setup as _log_setup
 from ._net_utils import DEFAULT_HEADERS
 
-# 3rd-party heavy deps are optional in constrained CI environments.
-# We fallback to lightweight stubs so the module can still import and our
-# tests can monkey-patch drivers without pulling gigabytes of data.
-try:
-    from datasets import get_dataset_config_names, load_dataset
-except ModuleNotFoundError:  # pragma: no cover – stubbed in minimal envs
-
-    def _missing(*_a: object, **_kw: object) -> Never:  # noqa: D401 — internal helper
-        raise ModuleNotFoundError(
-            "Package 'datasets' is required for this command; install with"
-            " 'pip install datasets' or use turkic-transliterate[cli] extra."
-        )
-
-    load_dataset = _missing
-    get_dataset_config_names = _missing
-
 try:
     from fasttext import load_model
 except ModuleNotFoundError:  # pragma: no cover – use stub in tests
@@ -51,6 +36,22 @@ except ModuleNotFoundError:  # pragma: no cover – use stub in tests
 
 from ._net_utils import url_ok
 
+
+# 3rd-party heavy deps are optional in constrained CI environments, and
+# ``datasets`` alone adds over a second to every ``turkic-translit`` start-up,
+# so it is imported on first use rather than at module import.
+def load_dataset(*args: Any, **kwargs: Any) -> Any:
+    """Call :func:`datasets.load_dataset`, importing ``datasets`` lazily."""
+    try:
+        from datasets import load_dataset as _load_dataset
+    except ModuleNotFoundError as e:  # pragma: no cover – minimal envs
+        raise ModuleNotFoundError(
+            "Package 'datasets' is required for this command; install with"
+            " 'pip install datasets' or use turkic-transliterate[cli] extra."
+        ) from e
+    return _load_dataset(*args, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 
 
@@ -159,17 +160,24 @@ DUMP_DIR.mkdir(parents=True, exist_ok=True)
 
 # --------------------------------------------------------------------------- drivers
 
-_FASTTEXT_CACHE: dict[str, Any] = {}
+# Sentences per fastText call when `download --filter-langid` is active
+_LID_BATCH = 1024
 
 
+@cache
 def _get_lid() -> Any:
+    """Resolve and load the LID model once; later drivers skip the path probe."""
     from turkic_translit.langid import FastTextLangID
     from turkic_translit.model_utils import ensure_fasttext_model
 
-    lid_path = str(ensure_fasttext_model())
-    if lid_path not in _FASTTEXT_CACHE:
-        _FASTTEXT_CACHE[lid_path] = FastTextLangID(lid_path)
-    return _FASTTEXT_CACHE[lid_path]
+    return FastTextLangID(str(ensure_fasttext_model()))
+
+
+def _nfc(s: str) -> str:
+    """NFC-normalise *s*, skipping the call for ASCII and already-NFC lines."""
+    if s.isascii() or ud.is_normalized("NFC", s):
+        return s
+    return ud.normalize("NFC", s)
 
 
 def stream_oscar(
@@ -228,7 +236,7 @@ def stream_oscar(
 
             txt = (row["text"] or "").strip()
             if txt:
-                txt = ud.normalize("NFC", txt)
+                txt = _nfc(txt)
                 if filter_langid and model is not None:
                     pred = model.predict(txt.replace("\n", " "))
                     if pred != filter_langid:
@@ -263,7 +271,7 @@ def _stream_wikipedia_xml(
                 for s in re.split(r"[.!?]", txt):
                     s = s.strip()
                     if s:
-                        s = ud.normalize("NFC", s)
+                        s = _nfc(s)
                         if filter_langid and model is not None:
                             pred = model.predict(s.replace("\n", " "))
                             if pred != filter_langid:
@@ -445,28 +453,38 @@ def _dl(
     stream_fn = _DRIVERS[cfg["driver"]]
     Path(out).parent.mkdir(parents=True, exist_ok=True)
     lines = 0
-    with open(out, "w", encoding="utf8") as fh:
+
+    def _lid_filtered(texts: Iterator[str]) -> Generator[str, None, None]:
+        """Keep *texts* whose FastText label is *filter_langid*, one batch at a time."""
+        lid = _get_lid()
+        while True:
+            # Never pull more lines than --max-lines could still accept
+            size = _LID_BATCH
+            if max_lines is not None:
+                size = max(1, min(size, max_lines - lines))
+            batch = list(islice(texts, size))
+            if not batch:
+                return
+            langs = lid.predict_tokens([t.replace("\n", " ") for t in batch])
+            yield from (t for t, pred in zip(batch, langs) if pred == filter_langid)
+
+    # Filter here rather than in the driver so each batch is a single
+    # fastText call instead of one call per line.
+    texts: Iterator[str] = stream_fn(lang, cfg, None)
+    if filter_langid:
+        texts = _lid_filtered(texts)
+    # Large buffer: corpora stream millions of short lines
+    with open(out, "w", encoding="utf8", buffering=1 << 18) as fh:
         start_time = time.time()
         last_progress_time = start_time
 
         logger.info("Starting to download and process corpus...")
 
         try:
-            for text in stream_fn(lang, cfg, filter_langid):
+            for text in texts:
                 if max_lines is not None and lines >= max_lines:
                     logger.info(f"Reached requested limit of {max_lines} lines")
                     break
-                # Optional post-filtering if driver did not honour --filter-langid
-                if filter_langid:
-                    # Lazily create the model once
-                    nonlocal_model: Any
-                    if "post_lid" not in locals():
-                        nonlocal_model = _get_lid()
-                        post_lid = nonlocal_model
-                    else:
-                        post_lid = locals().get("post_lid")
-                    if post_lid.predict(text.replace("\n", " ")) != filter_langid:
-                        continue
                 fh.write(text + "\n")
                 lines += 1
 
@@ -7,7 +7,6 @@ import logging
 
 import click
 
-from ..lm import DatasetStream, LMModel, cross_perplexity
 from ..logging_config import setup as _log_setup
 
 logger = logging.getLogger(__name__)
@@ -19,6 +18,10 @@ logger = logging.getLogger(__name__)
 @click.option("--sample", default=50_000, show_default=True, type=int)
 def cli(model: str, eval_lang: str, sample: int) -> None:
     """Compute sliding-window perplexity of *model* on *eval_lang* corpus."""
+    # Imported here: ..lm pulls in transformers/evaluate, which would
+    # otherwise slow down every turkic-translit invocation.
+    from ..lm import DatasetStream, LMModel, cross_perplexity
+
     _log_setup()
     logger.info("Loading model from %s", model)
     lm = LMModel.from_pretrained(model)
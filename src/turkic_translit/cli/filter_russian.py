@@ -144,7 +144,7 @@ def main(
             # Create debug info object
             debug_info = {
                 "tok": tok,
-                "rank1": lbl[0].replace("__label__", ""),
+                "rank1": lbl[0][9:],  # strip the "__label__" prefix
                 "conf1": round(conf[0], 2),
                 "ru_conf": round(ru_conf, 2),
             }
@@ -154,7 +154,7 @@ def main(
 
     for line in input:
         out = []
-        for tok in line.strip().split():
+        for tok in line.split():
             # Get the token prediction once for both decision and debug
             t = tok.lower()
             lbl, conf = lid.predict(t, k=3) if len(t) >= min_len else ([], [])
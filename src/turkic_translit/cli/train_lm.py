@@ -7,7 +7,6 @@ import logging
 
 import click
 
-from ..lm import DatasetStream, LMModel
 from ..logging_config import setup as _log_setup
 
 logger = logging.getLogger(__name__)
@@ -25,6 +24,10 @@ def cli(langs: str, base_model: str, epochs: int, output_dir: str) -> None:
         turkic-train-lm --langs kk,ky --base-model facebook/mGPT --epochs 1 \
             --output-dir runs/kkky_mgpt
     """
+    # Imported here: ..lm pulls in transformers/evaluate, which would
+    # otherwise slow down every turkic-translit invocation.
+    from ..lm import DatasetStream, LMModel
+
     _log_setup()
     iso_list = [iso.strip() for iso in langs.split(",") if iso.strip()]
     if not iso_list:
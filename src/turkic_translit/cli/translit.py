@@ -12,7 +12,11 @@ from __future__ import annotations
 import logging
 import sys
 import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import ExitStack, nullcontext
+from functools import partial
+from itertools import islice
 from typing import TextIO
 
 import click
@@ -21,12 +25,22 @@ from ..core import get_supported_languages, to_ipa, to_latin
 
 _logger = logging.getLogger(__name__)
 
+# Buffer size for file inputs/outputs: large corpora are written line by
+# line, and a 1 MiB buffer keeps that to one syscall per MiB.
+_IO_BUFFER_SIZE = 1 << 20
+
+# With --jobs > 1, input is read this many lines at a time and handed to the
+# worker pool in batches of _PARALLEL_CHUNKSIZE lines.
+_PARALLEL_CHUNK_LINES = 10_000
+_PARALLEL_CHUNKSIZE = 256
+
 
 def _open_input(stack: ExitStack, path: str, encoding: str) -> TextIO:
     """Open ``path`` for reading, or return ``sys.stdin`` when ``path`` is ``-``.
 
     The returned stream is registered with ``stack`` so callers do not
-    need a separate ``finally`` clause.
+    need a separate ``finally`` clause. Files are opened with a
+    :data:`_IO_BUFFER_SIZE` buffer.
 
     Args:
         stack: The active :class:`contextlib.ExitStack` that owns the
@@ -39,7 +53,7 @@ def _open_input(stack: ExitStack, path: str, encoding: str) -> TextIO:
     """
     if path == "-":
         return stack.enter_context(nullcontext(sys.stdin))
-    return stack.enter_context(open(path, encoding=encoding))
+    return stack.enter_context(open(path, encoding=encoding, buffering=_IO_BUFFER_SIZE))
 
 
 def _open_output(stack: ExitStack, path: str | None, encoding: str) -> TextIO | None:
@@ -47,6 +61,8 @@ def _open_output(stack: ExitStack, path: str | None, encoding: str) -> TextIO |
 
     Returns ``sys.stdout`` for ``"-"``, an opened file for a real path,
     and ``None`` when ``path`` itself is ``None`` (mode not requested).
+    Files get a :data:`_IO_BUFFER_SIZE` write buffer; stdout keeps its
+    own buffering so piped output still streams.
 
     Args:
         stack: The active :class:`contextlib.ExitStack` that owns the
@@ -63,7 +79,24 @@ def _open_output(stack: ExitStack, path: str | None, encoding: str) -> TextIO |
         return None
     if path == "-":
         return stack.enter_context(nullcontext(sys.stdout))
-    return stack.enter_context(open(path, "w", encoding=encoding))
+    return stack.enter_context(
+        open(path, "w", encoding=encoding, buffering=_IO_BUFFER_SIZE)
+    )
+
+
+def _translit_line(
+    line: str, lang: str, arabic: bool, latin: bool, ipa: bool
+) -> tuple[str | None, str | None]:
+    """Transliterate one input line into its ``(latin, ipa)`` output lines.
+
+    Module-level so that :class:`~concurrent.futures.ProcessPoolExecutor`
+    can pickle it. A mode that was not requested yields ``None``.
+    """
+    stripped = line.rstrip("\n")
+    return (
+        to_latin(stripped, lang, arabic) + "\n" if latin else None,
+        to_ipa(stripped, lang) + "\n" if ipa else None,
+    )
 
 
 def _stream_transliteration(
@@ -72,6 +105,7 @@ def _stream_transliteration(
     ipa_output: TextIO | None,
     lang: str,
     arabic: bool,
+    jobs: int = 1,
 ) -> int:
     """Read ``input_stream`` line-by-line and emit Latin / IPA output.
 
@@ -80,6 +114,9 @@ def _stream_transliteration(
     ``None`` for a mode they do not want emitted; that mode's
     per-line transliteration is skipped entirely (never computed).
 
+    With ``jobs > 1`` lines are transliterated in a process pool instead,
+    :data:`_PARALLEL_CHUNK_LINES` at a time; output order is preserved.
+
     Args:
         input_stream: File-like object yielding orthographic text lines.
         latin_output: Destination for Latin output, or ``None`` to skip
@@ -92,18 +129,38 @@ def _stream_transliteration(
             ``ar_lat.rules`` transliterator before the target rule set
             applies. Only meaningful when ``latin_output`` is not
             ``None``.
+        jobs: Number of worker processes; ``1`` runs in-process.
 
     Returns:
         The number of input lines consumed.
     """
+    translit_line = partial(
+        _translit_line,
+        lang=lang,
+        arabic=arabic,
+        latin=latin_output is not None,
+        ipa=ipa_output is not None,
+    )
+
+    def emit(results: Iterable[tuple[str | None, str | None]]) -> int:
+        count = 0
+        for latin_line, ipa_line in results:
+            if latin_output is not None and latin_line is not None:
+                latin_output.write(latin_line)
+            if ipa_output is not None and ipa_line is not None:
+                ipa_output.write(ipa_line)
+            count += 1
+        return count
+
+    if jobs <= 1:
+        return emit(map(translit_line, input_stream))
+
     lines_consumed = 0
-    for line in input_stream:
-        stripped = line.rstrip("\n")
-        if latin_output is not None:
-            latin_output.write(to_latin(stripped, lang, arabic) + "\n")
-        if ipa_output is not None:
-            ipa_output.write(to_ipa(stripped, lang) + "\n")
-        lines_consumed += 1
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while chunk := list(islice(input_stream, _PARALLEL_CHUNK_LINES)):
+            lines_consumed += emit(
+                pool.map(translit_line, chunk, chunksize=_PARALLEL_CHUNKSIZE)
+            )
     return lines_consumed
 
 
@@ -192,6 +249,13 @@ def _supported_lang_choices() -> list[str]:
     is_flag=True,
     help="Pre-pass Arabic script through ar_lat.rules before the target rules.",
 )
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Worker processes to transliterate with; 1 runs in-process.",
+)
 @click.option(
     "--benchmark",
     is_flag=True,
@@ -203,6 +267,7 @@ def translit(
     latin_path: str | None,
     ipa_path: str | None,
     arabic: bool,
+    jobs: int,
     benchmark: bool,
 ) -> None:
     """Transliterate ORTHOGRAPHY -> IPA and/or Latin using per-language rules.
@@ -216,6 +281,7 @@ def translit(
         latin_path: Value of ``--out-latin`` or ``None`` when omitted.
         ipa_path: Value of ``--out-ipa`` or ``None`` when omitted.
         arabic: Whether the ``--arabic`` flag was set.
+        jobs: Value of ``--jobs``.
         benchmark: Whether the ``--benchmark`` flag was set.
 
     Raises:
@@ -229,12 +295,13 @@ def translit(
 
     _logger.info(
         "Starting transliteration: lang=%s, input=%s, "
-        "out_latin=%s, out_ipa=%s, arabic=%s",
+        "out_latin=%s, out_ipa=%s, arabic=%s, jobs=%d",
         lang,
         input_path,
         latin_path,
         ipa_path,
         arabic,
+        jobs,
     )
 
     with ExitStack() as stack:
@@ -243,7 +310,7 @@ def translit(
         ipa_stream = _open_output(stack, ipa_path, encoding)
         start = time.time()
         n = _stream_transliteration(
-            input_stream, latin_stream, ipa_stream, lang, arabic
+            input_stream, latin_stream, ipa_stream, lang, arabic, jobs
         )
         elapsed = time.time() - start
 
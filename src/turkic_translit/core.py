@@ -12,6 +12,7 @@ names the caller's platform and the exact install command.
 
 from __future__ import annotations
 
+import re
 import sys
 import unicodedata as ud
 from functools import lru_cache
@@ -20,6 +21,16 @@ from typing import Any
 
 _RULE_DIR = Path(__file__).with_suffix("").parent / "rules"
 
+# Inputs longer than this bypass the to_latin / to_ipa result caches, so a
+# full cache holds at most 8192 short strings rather than whole documents.
+_TRANSLIT_CACHE_MAX_TEXT = 1024
+
+# A rule set whose last pass is ``:: NFC ;`` already emits NFC text
+_NFC_TAIL = re.compile(r"::\s*NFC\s*;\s*\Z")
+
+# Arabic and Arabic Supplement blocks: text without these skips ar_lat.rules
+_ARABIC_RE = re.compile(r"[\u0600-\u06FF\u0750-\u077F]")
+
 _INSTALL_INSTRUCTIONS: dict[str, str] = {
     "win32": (
         "On Windows, run:\n"
@@ -111,6 +122,10 @@ def get_supported_languages() -> dict[str, list[str]]:
 def _icu_trans(name: str) -> Any:
     """Load ``name`` from the rules directory and compile it via PyICU.
 
+    A trailing ``:: NFC ;`` pass is appended when the rule file does not
+    end with one, so every transliterator returns NFC text and callers
+    need no separate normalisation step.
+
     Args:
         name: The rule-file basename (e.g. ``"kk_ipa.rules"``).
 
@@ -128,30 +143,90 @@ def _icu_trans(name: str) -> Any:
     """
     icu = _require_icu()
     txt = (_RULE_DIR / name).read_text(encoding="utf8")
+    if not _NFC_TAIL.search(txt):
+        txt += "\n:: NFC ;\n"
     return icu.Transliterator.createFromRules(name, txt, 0)
 
 
-def to_latin(text: str, lang: str, include_arabic: bool = False) -> str:
-    """Transliterate ``text`` to Latin script using the ``lang`` rules.
+# Code points covered by the per-character Latin tables: ASCII, Latin-1 +
+# Latin Extended-A/B (Turkish input), the Cyrillic block and the Arabic block
+# (for the ``include_arabic`` pre-pass).
+_TABLE_CODEPOINTS = (
+    *range(0x80),
+    *range(0xA0, 0x250),
+    *range(0x400, 0x500),
+    *range(0x600, 0x700),
+)
 
-    Args:
-        text: The input string in the language's native orthography.
-        lang: ISO 639-1 language code. Must be a key of
-            :func:`get_supported_languages` for which the value
-            contains ``"latin"``.
-        include_arabic: When ``True``, pre-passes ``text`` through
-            ``ar_lat.rules`` before applying the target rule set.
-            Useful for input streams that mix Arabic-script tokens
-            (proper names, loanwords) into a Latin-target corpus.
 
-    Returns:
-        The Latin transliteration of ``text``, NFC-normalized.
+class _UnmappedCharError(Exception):
+    """Raised by :class:`_CharTable` for a code point it has no entry for."""
+
+
+class _CharTable(dict[int, str]):
+    """``str.translate`` table that aborts on characters it does not cover.
+
+    ``str.translate`` leaves unknown characters untouched when the lookup
+    raises ``LookupError``; raising a non-lookup error instead lets the
+    caller fall back to ICU without scanning the text for coverage first.
+    """
+
+    def __missing__(self, key: int) -> str:
+        raise _UnmappedCharError(key)
+
+
+def _is_char_map(rule_file: str) -> bool:
+    """Whether ``rule_file`` only maps single characters, without context.
+
+    For such rule sets, mapping each code point on its own gives the same
+    result as running ICU over the whole string. Context and anchors
+    (``{``, ``}``, ``^``, ``|``) or a multi-character source rule it out.
+    """
+    src = (_RULE_DIR / rule_file).read_text(encoding="utf8")
+    rules = "".join(line.split("#", 1)[0] for line in src.splitlines())
+    if any(op in rules for op in "{}^|"):
+        return False
+    sources = (rule.split(">", 1)[0].strip() for rule in rules.split(";"))
+    # ``:: NFC`` style lines are transforms, not mappings
+    return all(len(lhs) == 1 for lhs in sources if lhs and not lhs.startswith("::"))
+
+
+@lru_cache
+def _latin_char_table(*rule_files: str) -> _CharTable | None:
+    """Build a ``str.translate`` table equivalent to ``rule_files``, if possible.
+
+    The rule files are applied in order, so ``("ar_lat.rules", rule_file)``
+    folds the ``include_arabic`` pre-pass into the same table. Returns
+    ``None`` unless every file passes :func:`_is_char_map`; those rule sets
+    always go through ICU. Combining marks, and characters whose output is
+    not a standalone NFC string, are left out so that joining table outputs
+    is NFC without a normalisation pass; they fall back to ICU.
+    """
+    if not all(_is_char_map(rule_file) for rule_file in rule_files):
+        return None
+    chain = [_icu_trans(rule_file) for rule_file in rule_files]
+    table = _CharTable()
+    for cp in _TABLE_CODEPOINTS:
+        out = chr(cp)
+        for trans in chain:
+            out = trans.transliterate(out)
+        if ud.combining(chr(cp)) or (out and ud.combining(out[0])):
+            continue
+        if ud.is_normalized("NFC", out):
+            table[cp] = out
+    return table
+
+
+@lru_cache
+def _latin_rule_file(lang: str) -> str:
+    """Resolve the Latin rule-file name for ``lang``.
+
+    Cached so the rules-directory stats run once per language rather
+    than on every :func:`to_latin` call. Failed lookups raise and are
+    therefore not cached.
 
     Raises:
-        ValueError: When ``lang`` has no Latin rule file or no
-            ``<lang>_lat*.rules`` file is present.
-        RuntimeError: Propagated from :func:`_require_icu` when
-            PyICU is not installed.
+        ValueError: When ``lang`` has no Latin rule file.
     """
     supported = get_supported_languages()
 
@@ -167,22 +242,96 @@ def to_latin(text: str, lang: str, include_arabic: bool = False) -> str:
         f"{lang}_lat.rules",
         f"{lang}_latin.rules",
     ]
-    rule_file = None
-
     for rule in possible_rules:
         if (_RULE_DIR / rule).exists():
-            rule_file = rule
-            break
+            return rule
+
+    raise ValueError(f"No Latin rules file found for language '{lang}'")
+
 
-    if not rule_file:
-        raise ValueError(f"No Latin rules file found for language '{lang}'")
+@lru_cache
+def _ipa_rule_file(lang: str) -> str:
+    """Resolve the IPA rule-file name for ``lang``, cached like
+    :func:`_latin_rule_file`.
+
+    Raises:
+        ValueError: When ``lang`` has no IPA rule file.
+    """
+    supported = get_supported_languages()
 
+    if lang not in supported or "ipa" not in supported[lang]:
+        available = [code for code, fmts in supported.items() if "ipa" in fmts]
+        raise ValueError(
+            f"IPA transliteration not supported for '{lang}'. "
+            f"Available languages: {', '.join(sorted(available))}"
+        )
+
+    rule_file = f"{lang}_ipa.rules"
+    if not (_RULE_DIR / rule_file).exists():
+        raise ValueError(f"IPA rules file not found for language '{lang}'")
+    return rule_file
+
+
+def to_latin(text: str, lang: str, include_arabic: bool = False) -> str:
+    """Transliterate ``text`` to Latin script using the ``lang`` rules.
+
+    Args:
+        text: The input string in the language's native orthography.
+        lang: ISO 639-1 language code. Must be a key of
+            :func:`get_supported_languages` for which the value
+            contains ``"latin"``.
+        include_arabic: When ``True``, pre-passes ``text`` through
+            ``ar_lat.rules`` before applying the target rule set.
+            Useful for input streams that mix Arabic-script tokens
+            (proper names, loanwords) into a Latin-target corpus.
+
+    Returns:
+        The Latin transliteration of ``text``, NFC-normalized.
+
+    Raises:
+        ValueError: When ``lang`` has no Latin rule file or no
+            ``<lang>_lat*.rules`` file is present.
+        RuntimeError: Propagated from :func:`_require_icu` when
+            PyICU is not installed.
+    """
+    rule_file = _latin_rule_file(lang)
+    if text.isascii():
+        # Already Latin: the *_lat rule sets (and ar_lat) only rewrite
+        # non-ASCII letters, so ASCII input is a fixed point - skip ICU.
+        return text
+    impl = _to_latin_cached if len(text) <= _TRANSLIT_CACHE_MAX_TEXT else _to_latin_impl
+    return impl(text, rule_file, include_arabic)
+
+
+def _to_latin_impl(text: str, rule_file: str, include_arabic: bool) -> str:
+    """Body of :func:`to_latin`, keyed on the resolved rule file.
+
+    Memoized as :data:`_to_latin_cached`: corpora repeat lines (headers,
+    boilerplate, short tokens), and a hit skips the ICU passes. ASCII
+    input never gets here. No NFC pass is needed: the table only holds
+    NFC pieces and the ICU rule sets end with ``:: NFC``.
+    """
+    if include_arabic:
+        char_table = _latin_char_table("ar_lat.rules", rule_file)
+    else:
+        char_table = _latin_char_table(rule_file)
+    if char_table is not None:
+        try:
+            # One C-level pass when every character has a known mapping
+            return text.translate(char_table)
+        except _UnmappedCharError:
+            pass  # e.g. combining marks or other scripts: let ICU handle it
     trans = _icu_trans(rule_file)
     if include_arabic:
-        ar = _icu_trans("ar_lat.rules")
-        text = ar.transliterate(text)
-    out = trans.transliterate(text)
-    return ud.normalize("NFC", out)
+        if _ARABIC_RE.search(text):
+            text = _icu_trans("ar_lat.rules").transliterate(text)
+        else:
+            # No Arabic to map; keep the pre-pass's trailing NFC only
+            text = ud.normalize("NFC", text)
+    return str(trans.transliterate(text))
+
+
+_to_latin_cached = lru_cache(maxsize=8192)(_to_latin_impl)
 
 
 def to_ipa(text: str, lang: str) -> str:
@@ -202,18 +351,19 @@ def to_ipa(text: str, lang: str) -> str:
         RuntimeError: Propagated from :func:`_require_icu` when
             PyICU is not installed.
     """
-    supported = get_supported_languages()
+    impl = _to_ipa_cached if len(text) <= _TRANSLIT_CACHE_MAX_TEXT else _to_ipa_impl
+    return impl(text, lang)
 
-    if lang not in supported or "ipa" not in supported[lang]:
-        available = [code for code, fmts in supported.items() if "ipa" in fmts]
-        raise ValueError(
-            f"IPA transliteration not supported for '{lang}'. "
-            f"Available languages: {', '.join(sorted(available))}"
-        )
 
-    rule_file = f"{lang}_ipa.rules"
-    if not (_RULE_DIR / rule_file).exists():
-        raise ValueError(f"IPA rules file not found for language '{lang}'")
+def _to_ipa_impl(text: str, lang: str) -> str:
+    """Body of :func:`to_ipa`.
 
-    trans = _icu_trans(rule_file)
-    return ud.normalize("NFC", trans.transliterate(text))
+    Memoized as :data:`_to_ipa_cached`: token-level callers (the pipeline,
+    parametrised letter tests) repeat the same short inputs constantly; a
+    hit skips the ICU call. Errors are raised, never cached.
+    """
+    trans = _icu_trans(_ipa_rule_file(lang))
+    return str(trans.transliterate(text))
+
+
+_to_ipa_cached = lru_cache(maxsize=8192)(_to_ipa_impl)
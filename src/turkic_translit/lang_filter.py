@@ -6,55 +6,59 @@ Independent of any CLI / UI layer.  100 % unit-testable.
 from __future__ import annotations
 
 import re
-from typing import Any, Protocol
+from collections.abc import Sequence
+from typing import Any, Protocol, overload
 
 import numpy as np  # For typing
 
-__all__ = ["RU_ONLY", "KZ_EXTRA", "is_russian_token"]
+__all__ = [
+    "RU_ONLY",
+    "KZ_EXTRA",
+    "CYRILLIC",
+    "is_russian_token",
+    "russian_token_mask",
+]
 
 # --- public, reusable constants -------------------------------------------------
 RU_ONLY: re.Pattern[str] = re.compile(r"^[А-ЯЁа-яё]+$")  # pure Cyrillic, no Latin
 KZ_EXTRA: set[str] = set("ӘәҒғҚқҢңӨөҰұҮүҺһІі")  # absent from Russian
+CYRILLIC: re.Pattern[str] = re.compile(r"[\u0400-\u052F]")  # + Supplement block
+
+_Confs = np.ndarray[Any, np.dtype[np.float64]]
 
 
 # --- type protocol for fastText model -------------------------------------------
 class FastTextLike(Protocol):
+    @overload
+    def predict(self, text: str, k: int) -> tuple[list[str], _Confs]: ...
+    @overload
     def predict(
-        self, text: str, k: int
-    ) -> tuple[list[str], np.ndarray[Any, np.dtype[np.float64]]]: ...
+        self, text: list[str], k: int
+    ) -> tuple[list[list[str]], list[_Confs]]: ...
 
 
-# --- the one public function ----------------------------------------------------
-def is_russian_token(
-    token: str,
-    *,
-    thr: float,
-    min_len: int,
-    lid: FastTextLike,  # fastText model, already loaded
-    stoplist: set[str] | None = None,
-    margin: float = 0.10,
-) -> bool:
-    """
-    Return True iff *token* should be treated as Russian, under `thr`/`margin`.
-
-    • `thr` – minimum confidence required when RU is best label.
-    • `margin` – max distance RU may be behind the winner (0.10 ⇒ within 10 %).
-    • Orthography fallback is applied only when `thr == 0.0`.
-    """
+# --- internal helpers -----------------------------------------------------------
+def _candidate(token: str, min_len: int, stoplist: set[str] | None) -> str | None:
+    """Return the lower-cased *token* if it needs a fastText call, else None."""
     if len(token) < min_len:
-        return False
+        return None
+
+    if CYRILLIC.search(token) is None:
+        return None  # no Cyrillic letter at all → cannot be RU, skip fastText
 
     t = token.lower()
     if stoplist and t in stoplist:
-        return False
+        return None
 
-    if any(ch in KZ_EXTRA for ch in t):
-        return False  # Kazakh-specific letter → not RU
+    if not KZ_EXTRA.isdisjoint(t):
+        return None  # Kazakh-specific letter → not RU
+    return t
 
-    # ── fastText inference (single call) ────────────────────────────────────────
-    # FastText can return NumPy arrays or lists, depending on build.
-    labels, confs = lid.predict(t, k=3)
 
+def _is_russian_prediction(
+    t: str, labels: Sequence[str], confs: Any, *, thr: float, margin: float
+) -> bool:
+    """Apply the `thr`/`margin` rules to one fastText result for token *t*."""
     # Normalise to simple Python lists so the rest of the logic is type-safe
     labels = list(labels)
     if not isinstance(confs, list):
@@ -75,3 +79,89 @@ def is_russian_token(
 
     # orthography fallback only when slider is at the very bottom
     return thr == 0.0 and RU_ONLY.fullmatch(t) is not None
+
+
+# --- public functions -----------------------------------------------------------
+def is_russian_token(
+    token: str,
+    *,
+    thr: float,
+    min_len: int,
+    lid: FastTextLike,  # fastText model, already loaded
+    stoplist: set[str] | None = None,
+    margin: float = 0.10,
+) -> bool:
+    """
+    Return True iff *token* should be treated as Russian, under `thr`/`margin`.
+
+    • `thr` – minimum confidence required when RU is best label.
+    • `margin` – max distance RU may be behind the winner (0.10 ⇒ within 10 %).
+    • Orthography fallback is applied only when `thr == 0.0`.
+    """
+    t = _candidate(token, min_len, stoplist)
+    if t is None:
+        return False
+
+    # ── fastText inference (single call) ────────────────────────────────────────
+    # FastText can return NumPy arrays or lists, depending on build.
+    labels, confs = lid.predict(t, k=3)
+    return _is_russian_prediction(t, labels, confs, thr=thr, margin=margin)
+
+
+def russian_token_mask(
+    tokens: Sequence[str],
+    *,
+    thr: float,
+    min_len: int,
+    lid: FastTextLike,  # fastText model, already loaded
+    stoplist: set[str] | None = None,
+    margin: float = 0.10,
+) -> list[bool]:
+    """
+    Batched :func:`is_russian_token`: one flag per entry of *tokens*.
+
+    Tokens that survive the cheap length/Cyrillic/stoplist/Kazakh-letter
+    checks are sent to fastText in a single ``predict`` call instead of one
+    call each.
+    """
+    mask = [False] * len(tokens)
+    idx: list[int] = []
+    cands: list[str] = []
+    for i, token in enumerate(tokens):
+        t = _candidate(token, min_len, stoplist)
+        if t is not None:
+            idx.append(i)
+            cands.append(t)
+    if not cands:
+        return mask
+
+    labels_batch, confs_batch = lid.predict(cands, k=3)
+    widths = {len(labels) for labels in labels_batch}
+    widths.update(len(confs) for confs in confs_batch)
+    if len(widths) != 1:
+        # Ragged result (tiny models): fall back to the per-token rule
+        for i, t, labels, confs in zip(idx, cands, labels_batch, confs_batch):
+            mask[i] = _is_russian_prediction(t, labels, confs, thr=thr, margin=margin)
+        return mask
+    if widths == {0}:
+        return mask
+
+    # ── same rules as _is_russian_prediction, one NumPy pass over the batch ──
+    lab = np.asarray(labels_batch)
+    conf = np.asarray(confs_batch, dtype=np.float64)
+    is_ru = lab == "__label__ru"
+    ru_conf = np.where(is_ru, conf, -np.inf).max(axis=1)
+    ru_top = is_ru[:, 0] & (conf[:, 0] >= thr)  # RU is winner
+    ru_close = (  # RU close second/third
+        ~is_ru[:, 0] & (ru_conf >= thr) & (ru_conf >= conf[:, 0] - margin)
+    )
+    decision = ru_top | ru_close
+    if thr == 0.0:  # orthography fallback only at the very bottom
+        decision |= np.fromiter(
+            (RU_ONLY.fullmatch(t) is not None for t in cands),
+            dtype=bool,
+            count=len(cands),
+        )
+    for j in np.flatnonzero(decision):
+        mask[idx[j]] = True
+    return mask
@@ -1,5 +1,6 @@
 import logging
 import os
+import sys
 from typing import cast
 
 import fasttext
@@ -8,6 +9,9 @@ from .model_utils import ensure_fasttext_model
 
 logger = logging.getLogger(__name__)
 
+# fastText prefixes every label with exactly "__label__"
+_LABEL_PFX = len("__label__")
+
 
 class FastTextLangID:
     """
@@ -37,7 +41,7 @@ class FastTextLangID:
             logger.warning("Empty text passed to predict_with_prob")
             return "unknown", 0.0
         labels, probs = self.model.predict(clean, k=1)
-        lang = cast(str, labels[0]).replace("__label__", "")
+        lang = cast(str, labels[0])[_LABEL_PFX:]
         # Log suspicious results
         if lang == "en" and float(probs[0]) == 0.25001001358032227:
             logger.debug(
@@ -52,10 +56,16 @@ class FastTextLangID:
         # Remove SentencePiece underline and whitespace
         clean_text = text.replace("\u2581", "").strip()
         label = cast(str, self.model.predict(clean_text)[0][0])  # returns Any
-        return label.replace("__label__", "")
+        return label[_LABEL_PFX:]
 
     def predict_tokens(self, tokens: list[str]) -> list[str]:
         """
         Predict language for a list of tokens. Returns a list of language codes.
+        All tokens go to fastText in a single batched ``predict`` call; codes are
+        interned so callers grouping by language hash one shared string per code.
         """
-        return cast(list[str], [self.predict(token) for token in tokens])
+        if not tokens:
+            return []
+        clean = [token.replace("\u2581", "").strip() for token in tokens]
+        labels = cast(list[list[str]], self.model.predict(clean)[0])
+        return [sys.intern(label[0][_LABEL_PFX:]) for label in labels]
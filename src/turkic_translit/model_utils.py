@@ -38,9 +38,12 @@ References:
     }
 """
 
+import functools
 import logging
+import os
 import pathlib
 import urllib.request
+from collections.abc import Iterable
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -95,28 +98,58 @@ def download_fasttext_model(target_path: Optional[pathlib.Path] = None) -> pathl
         raise OSError(f"Failed to download FastText model: {e}") from e
 
 
-def ensure_fasttext_model() -> pathlib.Path:
+@functools.cache
+def _default_search_paths() -> tuple[pathlib.Path, ...]:
+    """Standard model locations in priority order, built once per process.
+
+    The package directory comes first, then ``web/`` and the user's home;
+    ``.bin`` files are listed before the compressed ``.ftz`` fallbacks.
+    """
+    pkg_dir = pathlib.Path(__file__).parent
+    dirs = (pkg_dir, pkg_dir / "web", pathlib.Path.home())
+    return tuple(d / "lid.176.bin" for d in dirs) + tuple(
+        d / "lid.176.ftz" for d in dirs
+    )
+
+
+def ensure_fasttext_model(
+    *, search_paths: Optional[Iterable[pathlib.Path]] = None
+) -> pathlib.Path:
     """
     Ensure the FastText language identification model is available.
     If not found in standard locations, will download it automatically.
 
+    Args:
+        search_paths: Optional candidate locations to probe instead of the
+            standard package/web/home locations. ``.bin`` entries are checked
+            before ``.ftz`` ones; a missing model is downloaded to the first
+            ``.bin`` entry (or the package directory if there is none).
+
+    Set ``TURKIC_LID_LOW_MEMORY=1`` to prefer an existing quantized
+    ``.ftz`` model (~1 MB) over the 126 MB ``.bin``; without one the usual
+    ``.bin`` lookup and download still apply.
+
     Returns:
         Path object to the model file
 
     Raises:
         OSError: If download fails and model cannot be found
     """
-    # Check standard locations first - prioritize the package directory version
-    pkg_dir = pathlib.Path(__file__).parent
-    pkg_lid = pkg_dir / "lid.176.bin"  # Prioritize the bin file in package directory
-    web_lid = pkg_dir / "web" / "lid.176.bin"
-    home_lid = pathlib.Path.home() / "lid.176.bin"
+    paths = _default_search_paths() if search_paths is None else tuple(search_paths)
+    bin_paths = [p for p in paths if p.suffix == ".bin"]
+    ftz_paths = [p for p in paths if p.suffix != ".bin"]
+
+    if os.getenv("TURKIC_LID_LOW_MEMORY") == "1":
+        for path in ftz_paths:
+            if path.exists():
+                logger.info(f"Low-memory mode: using FastText ftz model at {path}")
+                return path
 
     # Try to find an existing bin model file first
     # Expected full model size ~126 MB; treat anything <100 MB as suspicious
     min_bin_bytes = 100 * 1024 * 1024  # 100 MB
 
-    for path in [pkg_lid, web_lid, home_lid]:
+    for path in bin_paths:
         if path.exists():
             size = path.stat().st_size
             if size < min_bin_bytes:
@@ -128,15 +161,14 @@ def ensure_fasttext_model() -> pathlib.Path:
             return path
 
     # If no bin file found, check for compressed ftz files
-    pkg_lid_ftz = pkg_dir / "lid.176.ftz"
-    web_lid_ftz = pkg_dir / "web" / "lid.176.ftz"
-    home_lid_ftz = pathlib.Path.home() / "lid.176.ftz"
-
-    for path in [pkg_lid_ftz, web_lid_ftz, home_lid_ftz]:
+    for path in ftz_paths:
         if path.exists():
             logger.info(f"Found existing FastText ftz model at {path}")
             return path
 
-    # If not found, download to package directory
+    # If not found, download to the preferred bin location
     logger.info("FastText model not found in standard locations, downloading...")
-    return download_fasttext_model(pkg_lid)
+    target = (
+        bin_paths[0] if bin_paths else pathlib.Path(__file__).parent / "lid.176.bin"
+    )
+    return download_fasttext_model(target)
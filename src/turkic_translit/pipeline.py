@@ -14,20 +14,26 @@ class TurkicTransliterationPipeline:
         sp_model_path: str | None = None,
         ft_model_path: str | None = None,
         mode: str = "latin",
+        langid: FastTextLangID | None = None,
     ) -> None:
         self.tokenizer = TurkicTokenizer(sp_model_path)
-        self.langid = FastTextLangID(ft_model_path)
+        # An already-loaded wrapper (e.g. a process-wide one) avoids a second
+        # copy of the fastText model; ft_model_path is ignored in that case.
+        self.langid = langid if langid is not None else FastTextLangID(ft_model_path)
         self.mode = mode  # 'latin' or 'ipa'
 
-    def process(self, text: str) -> str:
+    def process(self, text: str, mode: str | None = None) -> str:
         """
         Tokenizes text, predicts language for each token, transliterates, and detokenizes.
+        *mode* overrides ``self.mode`` for this call only, so a shared pipeline
+        can serve both modes without being mutated.
         Returns the final transliterated string.
         """
+        if mode is None:
+            mode = self.mode
         tokens = self.tokenizer.tokenize(text)
         langs = self.langid.predict_tokens(tokens)
         transliterated = [
-            transliterate_token(token, lang, self.mode)
-            for token, lang in zip(tokens, langs)
+            transliterate_token(token, lang, mode) for token, lang in zip(tokens, langs)
         ]
         return self.tokenizer.detokenize(transliterated)
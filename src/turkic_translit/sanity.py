@@ -1,29 +1,34 @@
 """Helper functions for Levenshtein and byte checks."""
 
 import os
+from itertools import islice
 
+import numpy as np
 from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cpdist
 
 
 def median_lev(file_lat: str, file_ipa: str, sample: int = 5000) -> float:
     from statistics import median
 
-    m = []
     with (
         open(file_lat, encoding="utf8") as f1,
         open(file_ipa, encoding="utf8") as f2,
     ):
-        for i, (line, i_) in enumerate(zip(f1, f2)):
-            if i == sample:
-                break
-            m.append(Levenshtein.normalized_distance(line.strip(), i_.strip()))
-    return median(m)
+        pairs = [(line.strip(), i_.strip()) for line, i_ in islice(zip(f1, f2), sample)]
+    lat = [a for a, _ in pairs]
+    ipa = [b for _, b in pairs]
+    # Pairwise distances in one C call instead of one Python call per line
+    m = cpdist(lat, ipa, scorer=Levenshtein.normalized_distance, dtype=np.float64)
+    dists: list[float] = m.tolist()
+    return median(dists)
 
 
 def bytes_per_char(filename: str) -> float:
     b = os.path.getsize(filename)
     with open(filename, encoding="utf8") as f:
-        chars = sum(len(line) for line in f)
+        # Count in 1 MiB chunks rather than splitting into lines
+        chars = sum(len(chunk) for chunk in iter(lambda: f.read(1 << 20), ""))
     return b / chars
 
 
@@ -31,4 +36,7 @@ def is_nfc(filename: str) -> bool:
     import unicodedata
 
     with open(filename, encoding="utf8") as f:
-        return all(unicodedata.is_normalized("NFC", line) for line in f)
+        # ASCII lines are always NFC; isascii() is a flag check on str
+        return all(
+            line.isascii() or unicodedata.is_normalized("NFC", line) for line in f
+        )
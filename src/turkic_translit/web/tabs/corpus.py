@@ -35,9 +35,11 @@ def register() -> None:
 
                 @lru_cache(maxsize=1)
                 def _fasttext_langs() -> set[str]:
-                    from turkic_translit.langid import FastTextLangID
+                    from turkic_translit.web.web_utils import get_langid
 
-                    mdl = FastTextLangID()
+                    # Reuse the shared LangID singleton rather than loading
+                    # a second copy of the model for the label list
+                    mdl = get_langid()
                     return {
                         lab.replace("__label__", "") for lab in mdl.model.get_labels()
                     }
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import functools
+import io
 import json
 import logging
 import os
+import re
+import shutil
 import tempfile
 import threading
 import time
 import typing as t
 from pathlib import Path
-from types import ModuleType
 from typing import TYPE_CHECKING
 
 from turkic_translit.lang_utils import pretty_lang
@@ -29,15 +31,20 @@ except ModuleNotFoundError:  # pragma: no cover
 
     gr = _t.cast(_t.Any, None)
 
-from ..lang_filter import is_russian_token
+from ..lang_filter import CYRILLIC, russian_token_mask
 from ..langid import FastTextLangID
 
 log = logging.getLogger(__name__)
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Shared compact encoder for mask_russian's debug payload
+_DBG_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
 # Directory for temporary corpus downloads – excluded from VCS via .gitignore
 
 _CRON_DIR = Path(os.getenv("TURKIC_CRON_DIR", Path.cwd() / "cronjob"))
 _CRON_DIR.mkdir(parents=True, exist_ok=True)
+_CRON_DIR_STR = os.fspath(_CRON_DIR)
 
 
 # Start a background janitor thread to purge files older than 10 min.
@@ -120,13 +127,86 @@ def _make_pipeline() -> TurkicTransliterationPipeline:
     from ..pipeline import TurkicTransliterationPipeline  # Import from main package
 
     log.info("Instantiating TurkicTransliterationPipeline singleton")
-    return TurkicTransliterationPipeline()
+    # Share the LangID wrapper mask_russian uses instead of loading it twice
+    return TurkicTransliterationPipeline(langid=get_langid())
+
+
+# Both singletons are slow to build and Gradio handlers run concurrently, so
+# first construction is double-checked under a lock; later calls skip it.
+# Keep the builders as module-level functions: memoizing a method instead
+# would pin every instance (and its models) in the cache for process life.
+_PIPELINE: TurkicTransliterationPipeline | None = None
+_PIPELINE_LOCK = threading.Lock()
+
+
+def _lazy_pipeline() -> TurkicTransliterationPipeline:
+    """Return the shared pipeline, building it on first use."""
+    global _PIPELINE
+    if _PIPELINE is None:
+        with _PIPELINE_LOCK:
+            if _PIPELINE is None:
+                _PIPELINE = _make_pipeline()
+    return _PIPELINE
+
+
+_LANGID: FastTextLangID | None = None
+_LANGID_LOCK = threading.Lock()
+
+
+def get_langid() -> FastTextLangID:
+    """Return the shared FastText language ID wrapper, loading it on first use."""
+    global _LANGID
+    if _LANGID is None:
+        with _LANGID_LOCK:
+            if _LANGID is None:
+                _LANGID = FastTextLangID()
+    return _LANGID
+
 
+def prewarm() -> None:
+    """
+    Load the shared LangID model and pipeline before the first request.
+
+    Opt-in: call once at process start (e.g. before ``demo.launch()``) to move
+    model-loading latency out of the first user request. A missing
+    SentencePiece model only skips the pipeline; the tabs that need it report
+    the problem themselves.
+    """
+    get_langid()
+    try:
+        _lazy_pipeline()
+    except OSError as e:
+        log.warning(f"Pipeline not pre-warmed: {e}")
+
+
+def _start_prewarm() -> None:
+    """Run :func:`prewarm` in a daemon thread at import when ``TURKIC_WARMUP=1``."""
+    if os.getenv("TURKIC_WARMUP") != "1":
+        return
+
+    def _warm() -> None:
+        try:
+            prewarm()
+        except Exception:  # pragma: no cover – background safety
+            log.exception("Model warm-up failed")
 
-_lazy_pipeline = functools.lru_cache(maxsize=1)(_make_pipeline)
+    threading.Thread(target=_warm, daemon=True, name="model-warmup").start()
 
-# Create a singleton for the language ID model
-_langid_singleton = functools.lru_cache(maxsize=1)(FastTextLangID)
+
+_start_prewarm()
+
+
+# Inputs longer than this bypass the pipeline_transliterate result cache.
+_PIPELINE_CACHE_MAX_TEXT = 4096
+
+
+def _utf8_len(s: str) -> int:
+    """Byte length of *s* in UTF-8; ASCII strings skip the encode."""
+    return len(s) if s.isascii() else len(s.encode("utf8"))
+
+
+# Output-format labels for the stats line, keyed by normalised out_fmt
+_FMT_LABEL = {"latin": "LATIN", "ipa": "IPA"}
 
 
 def direct_transliterate(
@@ -137,33 +217,42 @@ def direct_transliterate(
     Usage: direct_transliterate('сәлем', 'kk', False, 'latin')
     Returns: (result, stats_markdown)
     Raises: ValueError if out_fmt is invalid.
+    Repeated inputs are served from the to_latin / to_ipa caches in core.
     """
-    from ..core import to_ipa, to_latin  # Import from main package
-
     # Correlation for this user action
     set_correlation_id()
     set_request_context(action="direct_transliterate", lang=lang, out_fmt=out_fmt)
 
     fmt = out_fmt.lower()
-    if fmt not in {"latin", "ipa"}:
+    if fmt not in _FMT_LABEL:
         raise ValueError(f"out_fmt must be 'latin' or 'ipa', got {out_fmt!r}")
+    from ..core import to_ipa, to_latin  # Import from main package
+
     if fmt == "latin":
         result = to_latin(text, lang, include_arabic)
     else:
         result = to_ipa(text, lang)
-    stats_markdown = (
-        f"**Bytes** — Cyrillic : {len(text.encode('utf8'))}, "
-        f"{fmt.upper()} : {len(result.encode('utf8'))}"
-    )
+    stats_markdown = f"**Bytes** — Cyrillic : {_utf8_len(text)}, {_FMT_LABEL[fmt]} : {_utf8_len(result)}"
     return result, stats_markdown
 
 
+def _pipeline_impl(text: str, mode: str) -> tuple[str, str]:
+    # Pass the mode per call: the singleton is shared across request threads
+    result = _lazy_pipeline().process(text, mode=mode)
+    stats_markdown = f"**{len(result)} chars**"
+    return result, stats_markdown
+
+
+_cached_pipeline = functools.lru_cache(maxsize=1024)(_pipeline_impl)
+
+
 def pipeline_transliterate(text: str, mode: str) -> tuple[str, str]:
     """
     Transliterate text using the pipeline (mode: 'latin' or 'ipa').
     Usage: pipeline_transliterate('сәлем', 'ipa')
     Returns: (result, stats_markdown)
     Raises: ValueError if mode is invalid (passed to pipeline).
+    Results for inputs up to _PIPELINE_CACHE_MAX_TEXT chars are memoized.
     """
     # Correlation for this user action
     set_correlation_id()
@@ -172,25 +261,8 @@ def pipeline_transliterate(text: str, mode: str) -> tuple[str, str]:
     mode = mode.lower()
     if mode not in {"latin", "ipa"}:
         raise ValueError(f"mode must be 'latin' or 'ipa', got {mode!r}")
-    pipeline = _lazy_pipeline()
-    pipeline.mode = mode
-    result = pipeline.process(text)
-    stats_markdown = f"**{len(result)} chars**"
-    return result, stats_markdown
-
-
-# Soft import pandas at module level
-
-# Soft import pandas - using TYPE_CHECKING pattern to provide type hints
-# without requiring pandas at import time
-if TYPE_CHECKING:
-    import pandas as pd
-else:
-    # Runtime pandas import with fallback
-    try:
-        import pandas as pd
-    except ModuleNotFoundError:  # pragma: no cover
-        pd: ModuleType | None = None
+    impl = _cached_pipeline if len(text) <= _PIPELINE_CACHE_MAX_TEXT else _pipeline_impl
+    return impl(text, mode)
 
 
 def token_table_markdown(text: str) -> str:
@@ -198,24 +270,21 @@ def token_table_markdown(text: str) -> str:
     Tokenize text and return a markdown table of tokens and language predictions.
     Usage: token_table_markdown('сәлем әлем!')
     Returns: markdown string
-    Raises: ImportError if pandas is not installed.
     """
     # Correlation for this user action
     set_correlation_id()
     set_request_context(action="token_table", sample=len(text))
 
-    if pd is None:
-        raise ImportError(
-            "install turkic-transliterate[ui] to use token_table_markdown"
-        )
-
     try:
         pipeline = _lazy_pipeline()
         tokens = pipeline.tokenizer.tokenize(text)
         langs = pipeline.langid.predict_tokens(tokens)
-        df = pd.DataFrame({"Token": tokens, "Lang": langs})
-        markdown_table: str = df.to_markdown(index=False)
-        return markdown_table
+        rows = ["| Token | Lang |", "|---|---|"]
+        rows.extend(
+            "| " + tok.replace("|", "\\|") + f" | {lang} |"
+            for tok, lang in zip(tokens, langs)
+        )
+        return "\n".join(rows)
     except OSError as e:
         if "turkic_model.model" in str(e):
             return (
@@ -244,42 +313,53 @@ def mask_russian(
     Returns:
         Masked text with <RU> replacing Russian tokens
     """
-    import re
-
-    _ansi_re = re.compile(r"\x1b\[[0-9;]*m")
-
     # Correlation for this user action
     set_correlation_id()
     set_request_context(action="mask_russian", thr=thr, min_len=min_len)
 
+    tokens = text.split()
+    if not debug and CYRILLIC.search(text) is None:
+        # Nothing can be Russian: skip loading / querying fastText entirely
+        out = " ".join(tokens)
+        return _ANSI_RE.sub("", out) if "\x1b" in out else out
+
     try:
-        # Get model from singleton
-        lid = _langid_singleton().model
+        # Get model from the shared wrapper
+        lid = get_langid().model
         stoplist = None  # future hook – can come from UI later
-        masked, dbg = [], []
-
-        for tok in text.strip().split():
-            ru = is_russian_token(
-                tok, thr=thr, min_len=min_len, lid=lid, stoplist=stoplist, margin=margin
-            )
-            masked.append("<RU>" if ru else tok)
+        flags = russian_token_mask(  # one batched fastText call
+            tokens,
+            thr=thr,
+            min_len=min_len,
+            lid=lid,
+            stoplist=stoplist,
+            margin=margin,
+        )
+        masked = ["<RU>" if ru else tok for tok, ru in zip(tokens, flags)]
 
-            if debug:
-                # json-serialisable per-token info
-                lbls, confs = lid.predict(tok.lower(), k=1)
-                dbg.append(
+        out = " ".join(masked)
+        if debug:
+            dbg = []
+            if tokens:
+                # json-serialisable per-token info, again from a single batch call
+                lbls_batch, confs_batch = lid.predict(
+                    [tok.lower() for tok in tokens], k=1
+                )
+                dbg = [
                     {
                         "tok": tok,
                         "ru": ru,
                         "winner": lbls[0][9:],
                         "conf": float(confs[0]),
                     }
-                )
-
-        out = " ".join(masked)
-        if debug:
-            out += "\n\n<!--debug " + json.dumps(dbg, ensure_ascii=False) + " -->"
-        return _ansi_re.sub("", out)
+                    for tok, ru, lbls, confs in zip(
+                        tokens, flags, lbls_batch, confs_batch
+                    )
+                ]
+            out += "\n\n<!--debug " + _DBG_ENCODE(dbg) + " -->"
+        if "\x1b" in out:
+            out = _ANSI_RE.sub("", out)
+        return out
 
     except Exception as e:
         log.warning(f"Failed to process text with FastText model: {e}")
@@ -338,7 +418,6 @@ def download_corpus_to_file(
     the file for download **and** show a summary message.
     """
     import logging
-    from pathlib import Path
 
     from turkic_translit.cli import download_corpus as dl
 
@@ -378,9 +457,9 @@ def download_corpus_to_file(
 
     model: FastTextLangID | None = None
     if filter_langid:
-        logger.info("Getting FastText language ID model from singleton...")
+        logger.info("Getting shared FastText language ID model...")
         try:
-            model = _langid_singleton()
+            model = get_langid()
             logger.info(f"FastText model loaded successfully: {model}")
         except Exception:
             logger.exception("Failed to load FastText model")
@@ -391,10 +470,9 @@ def download_corpus_to_file(
     removed = 0
     total_processed = 0
 
-    with open(
-        _CRON_DIR / f"{source}_{lang}_{int(time.time())}.txt", "w", encoding="utf8"
-    ) as tmp:
-        tmp_path = tmp.name  # capture early so it is available after context closes
+    filename = f"{source}_{lang}_{int(time.time())}.txt"
+    tmp_path = os.path.join(_CRON_DIR_STR, filename)
+    with open(tmp_path, "w", encoding="utf8", buffering=1 << 20) as tmp:
         logger.info(f"Starting to process sentences (max_lines={max_lines})...")
         # Ensure *i* is defined even when the iterator is empty
         for sentence in base_iter:
@@ -443,9 +521,6 @@ def download_corpus_to_file(
                     if i % 100 == 0:  # Less frequent logging when no limit
                         logger.info(f"Progress: {progress_msg}")
 
-    # Capture file path after context manager closes it
-    tmp_path = tmp.name
-
     progress_fn(1.0, desc="completed")
 
     # Compute how many lines were skipped when language filtering is active
@@ -466,11 +541,25 @@ def download_corpus_to_file(
             if filter_langid
             else ""
         )
-        + f"- **File:** `{Path(tmp_path).name}`\n"
+        + f"- **File:** `{filename}`\n"
     )
     return tmp_path, info_md
 
 
+def _available_cpus() -> int:
+    """CPUs this process may run on, honouring affinity masks and cpusets."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows / macOS
+        return os.cpu_count() or 4
+
+
+def _iter_lines(text: str) -> t.Iterator[str]:
+    """Yield the lines of *text* one at a time, without ``\n`` / ``\r\n``."""
+    for line in io.StringIO(text):
+        yield line.rstrip("\r\n")
+
+
 def train_sentencepiece_model(
     input_text: str,
     training_file: t.Any = None,
@@ -504,7 +593,8 @@ def train_sentencepiece_model(
             "SentencePiece is required for model training. Please install with: pip install sentencepiece"
         ) from err
 
-    if not input_text.strip() and not training_file:
+    text = input_text.strip()
+    if not text and not training_file:
         raise ValueError("Either input text or training file must be provided")
 
     # Create a temporary directory for training data and model files
@@ -513,20 +603,27 @@ def train_sentencepiece_model(
         training_data_path = temp_dir_path / "training_data.txt"
         model_prefix = temp_dir_path / "spm_model"
 
-        # Write input text to training file if provided
-        input_files = []
-
-        if input_text.strip():
-            with open(training_data_path, "w", encoding="utf-8") as f:
-                f.write(input_text.strip() + "\n")
-            input_files.append(str(training_data_path))
-
         # If a file was uploaded, use its path directly for SentencePiece training
         # This avoids loading large files into memory
-        if training_file:
-            file_path = getattr(training_file, "name", None)
+        file_path = getattr(training_file, "name", None) if training_file else None
+
+        source: dict[str, t.Any]
+        if text and not file_path:
+            # Pasted text only: hand the lines straight to the trainer instead
+            # of writing them to disk for SentencePiece to read back.
+            source = {"sentence_iterator": _iter_lines(text)}
+        else:
+            input_files = []
+            if text:
+                # Two writes rather than one ``text + "\n"`` full-size copy
+                with open(training_data_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                    f.write("\n")
+                input_files.append(str(training_data_path))
             if file_path:
                 input_files.append(file_path)
+            # SentencePiece accepts comma-separated file paths
+            source = {"input": ",".join(input_files)}
 
         # Parse user symbols
         user_symbols_list = [s.strip() for s in user_symbols.split(",") if s.strip()]
@@ -534,9 +631,7 @@ def train_sentencepiece_model(
         # Train the model with all input files
         # This approach is more memory-efficient for large files
         spm.SentencePieceTrainer.train(
-            input=",".join(
-                input_files
-            ),  # SentencePiece accepts comma-separated file paths
+            **source,
             model_prefix=str(model_prefix),
             vocab_size=vocab_size,
             model_type=model_type,
@@ -546,31 +641,39 @@ def train_sentencepiece_model(
             # Additional parameters that help with large corpus files
             input_sentence_size=10000000,  # Process up to 10M sentences (plenty for most use cases)
             shuffle_input_sentence=True,  # Shuffle for better training outcome
-            num_threads=os.cpu_count()
-            or 4,  # Use multiple threads for faster processing
+            num_threads=_available_cpus(),  # Use multiple threads for faster processing
         )
 
         # Path to the output model file
         model_file_path = str(model_prefix) + ".model"
         vocab_file_path = str(model_prefix) + ".vocab"
 
-        # Count vocab items for stats
-        vocab_count = 0
-        with open(vocab_file_path, encoding="utf-8") as vocab_file:
-            for _ in vocab_file:
-                vocab_count += 1
+        # Count vocab items for stats (one entry per line; no need to decode)
+        with open(vocab_file_path, "rb") as vocab_file:
+            vocab_count = sum(
+                chunk.count(b"\n")
+                for chunk in iter(lambda: vocab_file.read(1 << 20), b"")
+            )
 
         # Get model file size
         model_size_bytes = os.path.getsize(model_file_path)
         model_size_kb = model_size_bytes / 1024
 
-        # Copy model to a more permanent location for download
+        # Move model to a more permanent location for download; the temp dir
+        # is deleted on exit, so a rename is safe.  Stream-copy when the
+        # rename crosses filesystems.
         output_model_path = (
             Path(tempfile.gettempdir())
             / f"turkic_sp_model_{vocab_size}_{model_type}.model"
         )
-        with open(model_file_path, "rb") as src, open(output_model_path, "wb") as dst:
-            dst.write(src.read())
+        try:
+            os.replace(model_file_path, output_model_path)
+        except OSError:
+            with (
+                open(model_file_path, "rb") as src,
+                open(output_model_path, "wb") as dst,
+            ):
+                shutil.copyfileobj(src, dst, length=1 << 20)
 
         # Create info message
         info_md = f"""### Model Training Complete
@@ -601,4 +704,6 @@ __all__ = [
     "train_sentencepiece_model",
     "labelise",
     "get_ui_log_handler",
+    "prewarm",
+    "get_langid",
 ]
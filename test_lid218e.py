@@ -7,11 +7,17 @@ This script tests:
 2. Returns script-aware labels (e.g., "uzb_Latn", "kaz_Cyrl")
 3. Can distinguish Uzbek Latin vs Cyrillic
 4. Can distinguish Kazakh, Kyrgyz, etc.
+5. Ranks a longer Uzbek Cyrillic passage as uzn_Cyrl within the top 5
 """
 
+from __future__ import annotations
+
 import os
 import sys
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 # Fix Windows encoding issues
 if sys.platform == "win32":
@@ -25,29 +31,50 @@ except ImportError:
     print("ERROR: fasttext not installed. Run: pip install fasttext")
     sys.exit(1)
 
+# Locations searched for the NLLB lid218e.bin model, in priority order
+LID218E_PATHS = (
+    Path("src/turkic_translit/lid218e.bin"),
+    Path("lid218e.bin"),
+    Path.home() / "lid218e.bin",
+)
 
-def test_lid218e():
-    """Test the lid218e model with various Turkic languages and scripts."""
+# fastText prefixes every label with exactly "__label__"
+_PFX = len("__label__")
 
-    # Find the model
-    model_paths = [
-        Path("src/turkic_translit/lid218e.bin"),
-        Path("lid218e.bin"),
-        Path.home() / "lid218e.bin",
-    ]
+# Longer Uzbek Cyrillic passage; short inputs are often confused with Tajik
+UZBEK_CYRILLIC_LONG = (
+    "Ўзбекистон Республикаси Марказий Осиёда жойлашган мустақил давлатдир. "
+    "Ўзбекистон халқи ўз тилида сўзлашади ва ўз маданиятига эга. "
+    "Тошкент Ўзбекистоннинг пойтахти ва энг катта шаҳридир."
+)
+
+
+def _clean(text: str) -> str:
+    """fastText predicts one line at a time, so fold newlines into spaces."""
+    return text.replace("\n", " ")
+
+
+def find_lid218e() -> Path | None:
+    """Return the first existing lid218e.bin location, or None."""
+    return next((path for path in LID218E_PATHS if path.exists()), None)
+
+
+@pytest.fixture(scope="module")
+def lid218e() -> Any:
+    """Load the 1.2 GB lid218e model once for this module."""
+    model_path = find_lid218e()
+    if model_path is None:
+        pytest.skip("lid218e.bin not found")
+    return fasttext.load_model(str(model_path))
 
-    model_path = None
-    for path in model_paths:
-        if path.exists():
-            model_path = path
-            print(f"Ã¢Å“â€œ Found model at: {path}")
-            print(f"  Size: {path.stat().st_size / (1024**3):.2f} GB\n")
-            break
 
+def load_lid218e() -> Any:
+    """Locate and load lid218e.bin for standalone runs, exiting if missing."""
+    model_path = find_lid218e()
     if not model_path:
         print("ERROR: lid218e.bin not found!")
         print("Please download it to one of these locations:")
-        for path in model_paths:
+        for path in LID218E_PATHS:
             print(f"  - {path}")
         print("\nDownload with:")
         print("  wget https://dl.fbaipublicfiles.com/nllb/lid/lid218e.bin")
@@ -55,10 +82,19 @@ def test_lid218e():
         print("  curl -O https://dl.fbaipublicfiles.com/nllb/lid/lid218e.bin")
         sys.exit(1)
 
+    print(f"✓ Found model at: {model_path}")
+    print(f"  Size: {model_path.stat().st_size / (1024**3):.2f} GB\n")
+
     # Load model
     print("Loading model (this may take a moment for 1.2GB file)...")
     model = fasttext.load_model(str(model_path))
-    print("Ã¢Å“â€œ Model loaded successfully!\n")
+    print("✓ Model loaded successfully!\n")
+    return model
+
+
+def test_lid218e(lid218e: Any) -> None:
+    """Test the lid218e model with various Turkic languages and scripts."""
+    model = lid218e
 
     # Test cases: (text, expected_lang, expected_script, acceptable_langs, description)
     # Note: lid218e returns ISO 639-3 codes; Uzbek is typically 'uzn' (Northern Uzbek).
@@ -106,16 +142,17 @@ def test_lid218e():
     failed = 0
     known_limitations = 0
 
+    # Predict every case in one batched call
+    labels_batch, probs_batch = model.predict([_clean(tc[0]) for tc in test_cases], k=1)
+
     for (
         text,
         expected_lang,
         expected_script,
         acceptable_langs,
         description,
-    ) in test_cases:
-        # Predict
-        labels, probs = model.predict(text, k=1)
-        full_label = labels[0].replace("__label__", "")
+    ), labels, probs in zip(test_cases, labels_batch, probs_batch):
+        full_label = labels[0][_PFX:]
         confidence = probs[0]
 
         # Parse result
@@ -192,9 +229,23 @@ def test_lid218e():
         print("\n✓ All tests passed! The model correctly detects scripts.")
 
 
+def test_uzbek_cyrillic_long(lid218e: Any) -> None:
+    """A longer Uzbek Cyrillic passage ranks uzn_Cyrl among the top 5 labels."""
+    labels, probs = lid218e.predict(_clean(UZBEK_CYRILLIC_LONG), k=5)
+    top5 = [label[_PFX:] for label in labels]
+
+    print("Top 5 predictions for longer Uzbek Cyrillic text:")
+    for i, (label, prob) in enumerate(zip(top5, probs)):
+        print(f"  {i + 1}. {label:15s} {prob:.4f}")
+
+    assert "uzn_Cyrl" in top5, f"uzn_Cyrl not in top 5: {top5}"
+
+
 if __name__ == "__main__":
     try:
-        test_lid218e()
+        model = load_lid218e()
+        test_lid218e(model)
+        test_uzbek_cyrillic_long(model)
     except AssertionError as e:
         print(e)
         sys.exit(1)
@@ -0,0 +1,40 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from turkic_translit.langid import FastTextLangID
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every test using :func:`ft_model` with ``fasttext``.
+
+    Runs before ``-m`` deselection, so ``-m "not fasttext"`` skips them.
+    """
+    for item in items:
+        if "ft_model" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.fasttext)
+
+
+@pytest.fixture(scope="session")
+def ft_model() -> FastTextLangID:
+    """Session-scoped fixture that returns a loaded FastTextLangID model.
+
+    The model is loaded (or downloaded) once for the whole session. If it
+    cannot be loaded (e.g. download blocked), dependent tests are skipped so
+    the rest of the suite can still run.
+    """
+    pytest.importorskip("fasttext")  # runtime dependency
+    from turkic_translit.langid import FastTextLangID
+    from turkic_translit.model_utils import ensure_fasttext_model
+
+    try:
+        # Ensure the model file exists/downloaded; raises on failure
+        return FastTextLangID(str(ensure_fasttext_model()))
+    except Exception as exc:  # pragma: no cover – environment without network
+        pytest.skip(f"FastText model unavailable: {exc}")
@@ -1,36 +1,26 @@
-import os
-import subprocess
-import sys
+from click.testing import CliRunner
 
-import pytest
+from turkic_translit.cli.build_spm import main as build_spm
+from turkic_translit.cli.filter_russian import main as filter_russian
+from turkic_translit.cli.run_leven import main as leven
+from turkic_translit.pyicu_install import main as pyicu_install
 
-SCRIPTS = os.path.join(sys.prefix, "Scripts")
-SUFFIX = ".cmd" if os.name == "nt" else ""
 
-
-@pytest.mark.usefixtures("tmp_path")
 def test_turkic_filter_russian_help() -> None:
-    subprocess.run(
-        [os.path.join(SCRIPTS, f"turkic-filter-russian{SUFFIX}"), "--help"], check=True
-    )
+    result = CliRunner().invoke(filter_russian, ["--help"])
+    assert result.exit_code == 0, result.output
 
 
-@pytest.mark.usefixtures("tmp_path")
 def test_turkic_build_spm_help() -> None:
-    subprocess.run(
-        [os.path.join(SCRIPTS, f"turkic-build-spm{SUFFIX}"), "--help"], check=True
-    )
+    result = CliRunner().invoke(build_spm, ["--help"])
+    assert result.exit_code == 0, result.output
 
 
-@pytest.mark.usefixtures("tmp_path")
 def test_turkic_pyicu_install_help() -> None:
-    subprocess.run(
-        [os.path.join(SCRIPTS, f"turkic-pyicu-install{SUFFIX}"), "--help"], check=True
-    )
+    result = CliRunner().invoke(pyicu_install, ["--help"])
+    assert result.exit_code == 0, result.output
 
 
-@pytest.mark.usefixtures("tmp_path")
 def test_turkic_leven_help() -> None:
-    subprocess.run(
-        [os.path.join(SCRIPTS, f"turkic-leven{SUFFIX}"), "--help"], check=True
-    )
+    result = CliRunner().invoke(leven, ["--help"])
+    assert result.exit_code == 0, result.output
@@ -205,3 +205,34 @@ def test_cli_requires_at_least_one_output(tmp_path: Path) -> None:
     result = _run_cli("--lang", "fi", "--in", str(input_file))
     assert result.returncode == 2, result.stderr
     assert "at least one of --out-latin or --out-ipa" in result.stderr
+
+
+def test_cli_jobs_matches_serial_output(tmp_path: Path) -> None:
+    """``--jobs 2`` writes the same lines, in the same order, as one process."""
+    lines = [f"мектеп {i} Ёлка ёжик" for i in range(600)]
+    input_file = tmp_path / "input_kk.txt"
+    input_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    outputs = {}
+    for jobs in ("1", "2"):
+        latin_file = tmp_path / f"out_{jobs}.lat.txt"
+        ipa_file = tmp_path / f"out_{jobs}.ipa.txt"
+        result = _run_cli(
+            "--lang",
+            "kk",
+            "--in",
+            str(input_file),
+            "--out-latin",
+            str(latin_file),
+            "--out-ipa",
+            str(ipa_file),
+            "--jobs",
+            jobs,
+        )
+        assert result.returncode == 0, result.stderr
+        outputs[jobs] = (
+            latin_file.read_text(encoding="utf-8"),
+            ipa_file.read_text(encoding="utf-8"),
+        )
+    assert outputs["2"] == outputs["1"]
+    assert outputs["1"][0].count("\n") == len(lines)
@@ -74,10 +74,10 @@ def test_train_lm_quick(monkeypatch: pytest.MonkeyPatch, tmp_output_dir: Path) -
         (Path(output_dir) / "config.json").write_text("{}")
         return _DummyLM()
 
-    monkeypatch.setattr("turkic_translit.cli.train_lm.LMModel.fresh", _fake_fresh)
+    monkeypatch.setattr("turkic_translit.lm.LMModel.fresh", _fake_fresh)
     # DatasetStream yields sentences – patch to predictable iterable
     monkeypatch.setattr(
-        "turkic_translit.cli.train_lm.DatasetStream",
+        "turkic_translit.lm.DatasetStream",
         lambda *_a, **_kw: ["foo", "bar"],
     )
 
@@ -113,14 +113,12 @@ def test_eval_lm_quick(monkeypatch: pytest.MonkeyPatch) -> None:
     dummy_lm = _DummyLM()
 
     monkeypatch.setattr(
-        "turkic_translit.cli.eval_lm.LMModel.from_pretrained",
+        "turkic_translit.lm.LMModel.from_pretrained",
         lambda *_a, **_kw: dummy_lm,
     )
+    monkeypatch.setattr("turkic_translit.lm.cross_perplexity", lambda *_a, **_kw: 2.34)
     monkeypatch.setattr(
-        "turkic_translit.cli.eval_lm.cross_perplexity", lambda *_a, **_kw: 2.34
-    )
-    monkeypatch.setattr(
-        "turkic_translit.cli.eval_lm.DatasetStream", lambda *_a, **_kw: ["x", "y", "z"]
+        "turkic_translit.lm.DatasetStream", lambda *_a, **_kw: ["x", "y", "z"]
     )
 
     runner = CliRunner()
@@ -47,6 +47,12 @@ def _dummy_driver(name: str) -> dl.StreamFn:
     return gen
 
 
+def _count_lines(path: Path) -> int:
+    """Count newlines in 1 MiB reads, so large outputs never sit in memory."""
+    with path.open("rb") as f:
+        return sum(buf.count(b"\n") for buf in iter(lambda: f.read(1 << 20), b""))
+
+
 # --------------------------------------------------------------------------- tests
 def test_list_sources_and_license(runner: CliRunner) -> None:
     res = runner.invoke(dl.cli, ["list-sources"])
@@ -111,7 +117,7 @@ def test_max_lines(
         ],
     )
     assert res.exit_code == 0
-    assert outfile.read_text().count("\n") == 3
+    assert _count_lines(outfile) == 3
 
 
 def test_filter_langid(
@@ -119,8 +125,8 @@ def test_filter_langid(
 ) -> None:
     """
     Simulate FastText filter: we monkey-patch _get_lid() to return a dummy
-    object whose .predict() returns 'dummy' for half the lines → only the
-    matching ones should survive.
+    object whose batched .predict_tokens() labels every other line 'ru' → only
+    the matching ones should survive.
     """
 
     class FakeFT:
@@ -132,6 +138,9 @@ def test_filter_langid(
             self.call += 1
             return "ru" if self.call % 2 else "en"
 
+        def predict_tokens(self, texts: list[str]) -> list[str]:
+            return [self.predict(t) for t in texts]
+
     monkeypatch.setattr(dl, "_get_lid", lambda: FakeFT())
 
     monkeypatch.setitem(dl._DRIVERS, "oscar", _dummy_driver("flt"))
@@ -159,8 +168,17 @@ def test_filter_langid(
     assert all("FLT_KK" in ln for ln in data)
 
 
+def test_nfc_fast_path() -> None:
+    """ASCII / already-NFC lines pass through untouched; others are composed."""
+    ascii_line = "plain ascii"
+    nfc_line = ud.normalize("NFC", "Türkiye")
+    assert dl._nfc(ascii_line) is ascii_line
+    assert dl._nfc(nfc_line) is nfc_line
+    assert dl._nfc(ud.normalize("NFD", "Türkiye")) == nfc_line
+
+
 # --------------------------------------------------------------------------- utilities
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner() -> CliRunner:
-    """Provide a Click CliRunner with env isolation."""
+    """Provide a Click CliRunner with env isolation, shared by the module's tests."""
     return CliRunner(env={"PYTHONIOENCODING": "utf8"})
@@ -6,6 +6,10 @@ that a few simple sentences are labelled with the expected language codes.
 We deliberately keep the sample short to avoid large downloads / long runtime.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 # NumPy 2.x still breaks the C++ fastText code – guard on major only
 import numpy as np
 import pytest
@@ -14,15 +18,10 @@ from packaging.version import parse as vparse
 if vparse(np.__version__).major >= 2:
     pytest.skip("fastText requires NumPy<2", allow_module_level=True)
 
-# Absent fasttext on non-Windows is fine – mark xfail
-from turkic_translit.langid import FastTextLangID
-from turkic_translit.model_utils import ensure_fasttext_model
-
 fasttext = pytest.importorskip("fasttext")  # runtime dependency
 
-# Load (or auto-download) model once per session
-model_path = ensure_fasttext_model()
-ft = FastTextLangID(str(model_path))
+if TYPE_CHECKING:
+    from turkic_translit.langid import FastTextLangID
 
 
 @pytest.mark.parametrize(
@@ -33,8 +32,8 @@ ft = FastTextLangID(str(model_path))
         ("Hello world", "en"),
     ],
 )
-def test_fasttext_predict(text: str, expected: str) -> None:
-    lang, prob = ft.predict_with_prob(text)
+def test_fasttext_predict(ft_model: FastTextLangID, text: str, expected: str) -> None:
+    lang, prob = ft_model.predict_with_prob(text)
     assert lang == expected
     # Lower threshold for "Hello world" as it's a short phrase
     min_prob = 0.15 if text == "Hello world" else 0.3
@@ -10,11 +10,13 @@ Source: https://www.cambridge.org/core/services/aop-cambridge-core/content/view/
 
 """
 
+from functools import lru_cache
 from unicodedata import category, normalize
 
 from turkic_translit.core import to_ipa
 
 
+@lru_cache(maxsize=64)
 def strip(s: str) -> str:
     return "".join(c for c in normalize("NFD", s) if category(c) != "Mn")
 
@@ -1,10 +1,11 @@
 import json
+import sys
 from typing import Any
 
 import numpy as np
 import pytest
 
-from turkic_translit.lang_filter import is_russian_token
+from turkic_translit.lang_filter import is_russian_token, russian_token_mask
 from turkic_translit.web.web_utils import mask_russian
 
 
@@ -12,21 +13,26 @@ class MockFastText:
     """Simple mock for FastText that returns predefined results"""
 
     def __init__(self) -> None:
-        self.responses: dict[str, tuple[list[str], list[float]]] = {}
+        self.responses: dict[str, tuple[list[str], Any]] = {}
 
     def set_response(
         self, text: str, labels: list[str], confidences: list[float]
     ) -> None:
-        """Set the response for a specific input text"""
-        self.responses[text] = (labels, confidences)
+        """Set the response for a specific input text (interned key, array built once)"""
+        self.responses[sys.intern(text)] = (
+            labels,
+            np.array(confidences, dtype=np.float64),
+        )
 
-    def predict(
-        self, text: str, k: int = 3
-    ) -> tuple[list[str], np.ndarray[Any, np.dtype[np.float64]]]:
+    def predict(self, text: str | list[str], k: int = 3) -> tuple[Any, Any]:
         """Predict method that returns our predefined responses"""
-        if text in self.responses:
-            labels, confs = self.responses[text]
-            return labels[:k], np.array(confs[:k], dtype=np.float64)
+        if isinstance(text, list):  # batched call, like fastText's own API
+            results = [self.predict(t, k) for t in text]
+            return [r[0] for r in results], [r[1] for r in results]
+        hit = self.responses.get(sys.intern(text))
+        if hit is not None:
+            labels, confs = hit
+            return labels[:k], confs[:k]
         return ["__label__en"], np.array([0.25], dtype=np.float64)  # Default response
 
 
@@ -225,16 +231,80 @@ def test_slider_equivalence(fasttext_mock: MockFastText) -> None:
     assert not results[5]  # At threshold 0.5
 
 
+def test_batched_mask_matches_single_token(fasttext_mock: MockFastText) -> None:
+    """russian_token_mask must agree with is_russian_token token by token"""
+    fasttext_mock.set_response("привет", ["__label__ru"], [0.9])
+    fasttext_mock.set_response("сәлем", ["__label__ru"], [0.9])
+    fasttext_mock.set_response(
+        "мир", ["__label__uk", "__label__ru", "__label__bg"], [0.55, 0.5, 0.2]
+    )
+    fasttext_mock.set_response("hello", ["__label__en"], [0.95])
+    tokens = ["Привет", "сәлем", "мир", "hello", "пр"]
+
+    mask = russian_token_mask(tokens, thr=0.5, min_len=3, lid=fasttext_mock)
+
+    expected = [
+        is_russian_token(tok, thr=0.5, min_len=3, lid=fasttext_mock) for tok in tokens
+    ]
+    assert mask == expected == [True, False, True, False, False]
+    assert russian_token_mask([], thr=0.5, min_len=3, lid=fasttext_mock) == []
+
+
+def test_non_cyrillic_tokens_skip_fasttext(fasttext_mock: MockFastText) -> None:
+    """Tokens without any Cyrillic letter are never sent to fastText"""
+    calls: list[str | list[str]] = []
+    predict = fasttext_mock.predict
+
+    def spy(text: str | list[str], k: int = 3) -> tuple[Any, Any]:
+        calls.append(text)
+        return predict(text, k)
+
+    fasttext_mock.predict = spy  # type: ignore[method-assign]
+    fasttext_mock.set_response("privet", ["__label__ru"], [0.9])
+    fasttext_mock.set_response("мир", ["__label__ru"], [0.9])
+
+    mask = russian_token_mask(
+        ["privet", "hello", "2024", "мир"], thr=0.5, min_len=3, lid=fasttext_mock
+    )
+
+    assert mask == [False, False, False, True]
+    assert calls[0] == ["мир"]  # the one batched call
+    assert not is_russian_token("privet", thr=0.0, min_len=3, lid=fasttext_mock)
+
+
+@pytest.mark.parametrize("thr", [0.0, 0.3, 0.5, 0.9])
+def test_vectorized_mask_matches_single_token(
+    fasttext_mock: MockFastText, thr: float
+) -> None:
+    """Full-width k=3 batches take the NumPy path; it must match the scalar rule"""
+    responses = {
+        "привет": (["__label__ru", "__label__uk", "__label__bg"], [0.8, 0.1, 0.05]),
+        "мир": (["__label__uk", "__label__ru", "__label__bg"], [0.55, 0.5, 0.2]),
+        "дом": (["__label__uk", "__label__bg", "__label__ru"], [0.5, 0.3, 0.2]),
+        "тест": (["__label__ru", "__label__uk", "__label__bg"], [0.4, 0.3, 0.2]),
+        "hello": (["__label__en", "__label__de", "__label__nl"], [0.9, 0.05, 0.01]),
+    }
+    for tok, (labels, confs) in responses.items():
+        fasttext_mock.set_response(tok, labels, confs)
+    tokens = list(responses)
+
+    mask = russian_token_mask(tokens, thr=thr, min_len=3, lid=fasttext_mock)
+
+    assert mask == [
+        is_russian_token(tok, thr=thr, min_len=3, lid=fasttext_mock) for tok in tokens
+    ]
+
+
 def test_web_integration(
     fasttext_mock: MockFastText, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Test integration with mask_russian function"""
-    # Mock the language ID singleton in web_utils
+    # Mock the shared language ID wrapper in web_utils
     from turkic_translit.web import web_utils
 
     monkeypatch.setattr(
         web_utils,
-        "_langid_singleton",
+        "get_langid",
         lambda: type("obj", (object,), {"model": fasttext_mock}),
     )
 
@@ -261,3 +331,16 @@ def test_web_integration(
     assert debug_data[0]["ru"] is True
     assert debug_data[2]["tok"] == "hello"
     assert debug_data[2]["ru"] is False
+
+
+def test_web_mask_skips_model_without_cyrillic(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Latin-only or empty input never loads the fastText model"""
+    from turkic_translit.web import web_utils
+
+    def _fail() -> None:
+        raise AssertionError("fastText model should not be loaded")
+
+    monkeypatch.setattr(web_utils, "get_langid", _fail)
+
+    assert mask_russian(text="  hello   world ", thr=0.5, min_len=3) == "hello world"
+    assert mask_russian(text="", thr=0.5, min_len=3) == ""
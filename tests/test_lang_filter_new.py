@@ -1,4 +1,5 @@
 import json
+import sys
 from typing import Any
 
 import numpy as np
@@ -12,21 +13,26 @@ class MockFastText:
     """Simple mock for FastText that returns predefined results"""
 
     def __init__(self) -> None:
-        self.responses: dict[str, tuple[list[str], list[float]]] = {}
+        self.responses: dict[str, tuple[list[str], Any]] = {}
 
     def set_response(
         self, text: str, labels: list[str], confidences: list[float]
     ) -> None:
-        """Set the response for a specific input text"""
-        self.responses[text] = (labels, confidences)
+        """Set the response for a specific input text (interned key, array built once)"""
+        self.responses[sys.intern(text)] = (
+            labels,
+            np.array(confidences, dtype=np.float64),
+        )
 
-    def predict(
-        self, text: str, k: int = 3
-    ) -> tuple[list[str], np.ndarray[Any, np.dtype[np.float64]]]:
+    def predict(self, text: str | list[str], k: int = 3) -> tuple[Any, Any]:
         """Predict method that returns our predefined responses"""
-        if text in self.responses:
-            labels, confs = self.responses[text]
-            return labels[:k], np.array(confs[:k], dtype=np.float64)
+        if isinstance(text, list):  # batched call, like fastText's own API
+            results = [self.predict(t, k) for t in text]
+            return [r[0] for r in results], [r[1] for r in results]
+        hit = self.responses.get(sys.intern(text))
+        if hit is not None:
+            labels, confs = hit
+            return labels[:k], confs[:k]
         return ["__label__en"], np.array([0.25], dtype=np.float64)  # Default response
 
 
@@ -202,12 +208,12 @@ def test_web_integration(
     fasttext_mock: MockFastText, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Test integration with mask_russian function"""
-    # Mock the language ID singleton in web_utils
+    # Mock the shared language ID wrapper in web_utils
     from turkic_translit.web import web_utils
 
     monkeypatch.setattr(
         web_utils,
-        "_langid_singleton",
+        "get_langid",
         lambda: type("obj", (object,), {"model": fasttext_mock}),
     )
 
@@ -15,27 +15,14 @@ that the on-disk model is broken.
 
 from __future__ import annotations
 
-import pytest
+from typing import TYPE_CHECKING
 
-from turkic_translit.langid import FastTextLangID
-from turkic_translit.model_utils import ensure_fasttext_model
+import pytest
 
 fasttext = pytest.importorskip("fasttext")  # runtime dependency
 
-
-@pytest.fixture(scope="session")
-def ft_model() -> FastTextLangID:
-    """Session-scoped fixture that returns a loaded FastTextLangID model.
-
-    If the binary model cannot be loaded (e.g. download blocked), the whole
-    test module is skipped so the rest of the suite can still run.
-    """
-    try:
-        # Ensure the model file exists/downloaded; raises on failure
-        ensure_fasttext_model()
-        return FastTextLangID()
-    except Exception as exc:  # pragma: no cover – environment without network
-        pytest.skip(f"FastText model unavailable: {exc}")
+if TYPE_CHECKING:
+    from turkic_translit.langid import FastTextLangID
 
 
 SAMPLES: dict[str, str] = {
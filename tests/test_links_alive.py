@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -6,15 +7,27 @@ from turkic_translit.cli import download_corpus as dl
 from turkic_translit.cli._net_utils import url_ok
 
 
+def _probe_url(cfg: dict[str, Any]) -> str:
+    if cfg["driver"] == "oscar":
+        return f"https://huggingface.co/api/datasets/{cfg['hf_name']}"
+    if cfg["driver"] == "wikipedia":
+        return "https://dumps.wikimedia.org/"
+    if cfg["driver"] == "leipzig":
+        return f"{cfg['base_url']}/deu_news_2012_1M.tar.gz"
+    return str(cfg["base_url"])
+
+
+@pytest.fixture(scope="module")
+def link_status() -> dict[str, bool]:
+    """Probe every distinct source URL once, concurrently."""
+    urls = sorted({_probe_url(cfg) for cfg in dl._REG.values()})
+    with ThreadPoolExecutor(max_workers=min(32, len(urls) or 1)) as pool:
+        return dict(zip(urls, pool.map(url_ok, urls)))
+
+
 @pytest.mark.network
 @pytest.mark.parametrize(("source", "cfg"), dl._REG.items())
-def test_head_ok(source: str, cfg: dict[str, Any]) -> None:
-    if cfg["driver"] == "oscar":
-        url = f"https://huggingface.co/api/datasets/{cfg['hf_name']}"
-    elif cfg["driver"] == "wikipedia":
-        url = "https://dumps.wikimedia.org/"
-    elif cfg["driver"] == "leipzig":
-        url = f"{cfg['base_url']}/deu_news_2012_1M.tar.gz"
-    else:
-        url = cfg["base_url"]
-    assert url_ok(url), f"{source} site unreachable"
+def test_head_ok(
+    source: str, cfg: dict[str, Any], link_status: dict[str, bool]
+) -> None:
+    assert link_status[_probe_url(cfg)], f"{source} site unreachable"
@@ -5,7 +5,6 @@ Tests for the automatic model download functionality.
 import os
 import pathlib
 import shutil
-import tempfile
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -17,14 +16,10 @@ from turkic_translit.model_utils import download_fasttext_model, ensure_fasttext
 class TestModelUtils:
     """Tests for the model_utils module."""
 
-    def setup_method(self) -> None:
-        """Set up temporary directory for tests."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_model_path = pathlib.Path(self.temp_dir) / "lid.176.bin"
-
-    def teardown_method(self) -> None:
-        """Clean up temporary directory after tests."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _temp_model_path(self, tmp_path: pathlib.Path) -> None:
+        """Point each test at a model path inside pytest's own tmp_path."""
+        self.temp_model_path = tmp_path / "lid.176.bin"
 
     @pytest.mark.skip(reason="Only run manually - downloads real model")
     def test_download_fasttext_model_real(self) -> None:
@@ -76,33 +71,31 @@ class TestModelUtils:
         self.temp_model_path.parent.mkdir(parents=True, exist_ok=True)
         self.temp_model_path.write_bytes(b"corrupted" * 100)  # Small file < 100MB
 
-        # Mock download to return a valid path
-        mock_download_return = self.temp_model_path
-
-        # Create a mock exists function that only returns True for our temp model path
-        def mock_exists_fn(path_obj: pathlib.Path) -> bool:
-            # Return True only for our temp model path, False for all other paths
-            return str(path_obj) == str(self.temp_model_path)
-
-        # Apply our patches
-        with (
-            # Mock Path.home to return our temp directory
-            patch("pathlib.Path.home", return_value=pathlib.Path(self.temp_dir)),
-            # Mock exists to only return True for our model
-            patch("pathlib.Path.exists", mock_exists_fn),
-            # Mock download to return our path
-            patch(
-                "turkic_translit.model_utils.download_fasttext_model",
-                return_value=mock_download_return,
-            ) as mock_download,
-        ):
-            # Call the function - should detect corrupted file and download
-            result = ensure_fasttext_model()
-            mock_download.assert_called_once()
+        with patch(
+            "turkic_translit.model_utils.download_fasttext_model",
+            return_value=self.temp_model_path,
+        ) as mock_download:
+            # Only probe our temp model - should detect corrupted file and download
+            result = ensure_fasttext_model(search_paths=[self.temp_model_path])
+            mock_download.assert_called_once_with(self.temp_model_path)
 
             # The function should return our temp model path
             assert result == self.temp_model_path
 
+    def test_low_memory_prefers_ftz(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """TURKIC_LID_LOW_MEMORY=1 picks the quantized model over a valid bin."""
+        ftz_path = self.temp_model_path.with_suffix(".ftz")
+        ftz_path.write_bytes(b"ftz")
+        with open(self.temp_model_path, "wb") as f:
+            f.truncate(100 * 1024 * 1024)  # sparse file passes the size check
+
+        paths = [self.temp_model_path, ftz_path]
+        monkeypatch.delenv("TURKIC_LID_LOW_MEMORY", raising=False)
+        assert ensure_fasttext_model(search_paths=paths) == self.temp_model_path
+
+        monkeypatch.setenv("TURKIC_LID_LOW_MEMORY", "1")
+        assert ensure_fasttext_model(search_paths=paths) == ftz_path
+
     @patch("turkic_translit.langid.ensure_fasttext_model")
     @patch("fasttext.load_model")
     def test_fasttext_langid_auto_download(
@@ -127,30 +120,36 @@ class TestModelUtils:
         # Verify model was set
         assert langid.model == mock_model
 
-    @patch("turkic_translit.langid.ensure_fasttext_model")
-    @patch("os.path.exists")
-    @patch("fasttext.load_model")
     def test_fasttext_langid_download_fallback(
-        self, mock_load_model: MagicMock, mock_exists: MagicMock, mock_ensure: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test FastTextLangID falls back to bin file when download fails."""
-        # Setup mocks to simulate download failure and bin file existence
-        mock_ensure.side_effect = Exception("Download failed")
-        mock_exists.return_value = True  # Simulate bin file exists
-        mock_model = MagicMock()
-        mock_load_model.return_value = mock_model
+
+        def fail_download() -> pathlib.Path:
+            raise Exception("Download failed")
+
+        # Simulate download failure; record the path handed to load_model
+        loaded: list[str] = []
+        fake_model = object()
+
+        def fake_load(path: str) -> object:
+            loaded.append(path)
+            return fake_model
+
+        monkeypatch.setattr(
+            "turkic_translit.langid.ensure_fasttext_model", fail_download
+        )
+        monkeypatch.setattr("fasttext.load_model", fake_load)
 
         # Test initialization (should try download, fail, then use bin)
         langid = FastTextLangID()
 
-        # Verify ensure_fasttext_model was called
-        mock_ensure.assert_called_once()
-
-        # Verify load_model was called with a path ending in lid.176.bin
-        assert mock_load_model.call_args[0][0].endswith("lid.176.bin")
+        # Verify load_model was called once with a path ending in lid.176.bin
+        assert len(loaded) == 1
+        assert loaded[0].endswith("lid.176.bin")
 
         # Verify model was set
-        assert langid.model == mock_model
+        assert langid.model is fake_model
 
 
 # Integration tests that require real model - these are skipped by default
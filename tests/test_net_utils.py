@@ -7,8 +7,8 @@ Two categories:
   Wikimedia's policy);
 * live network probes — real HTTP requests against ``dumps.wikimedia.org``
   confirming that the shipped User-Agent is not on Wikimedia's blocklist.
-  These are marked ``@pytest.mark.network`` so ``pytest -m "not network"``
-  skips them when the test host is offline.
+  These are marked ``@pytest.mark.network``, which ``pytest.ini`` deselects
+  by default; run them with ``pytest -m network``.
 """
 
 from __future__ import annotations
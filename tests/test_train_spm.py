@@ -13,12 +13,12 @@ whole suite stays well under 1 min even on CI.
 from __future__ import annotations
 
 import json
-import subprocess
-import sys
 from pathlib import Path
 
-import click  # for ClickException class used by CLI drivers
 import pytest
+from click.testing import CliRunner
+
+from turkic_translit.cli.train_spm import main as train_spm_cli
 
 PARAMS = [
     # (source-name, max_lines)
@@ -27,6 +27,7 @@ PARAMS = [
 ]
 
 
+@pytest.mark.network
 @pytest.mark.parametrize(("source", "max_lines"), PARAMS)
 def test_train_spm_each_source(tmp_path: Path, source: str, max_lines: int) -> None:
     """Train a tiny SPM model from each corpus driver and ensure it succeeds."""
@@ -34,10 +35,7 @@ def test_train_spm_each_source(tmp_path: Path, source: str, max_lines: int) -> N
     out_prefix = tmp_path / f"turkic_{source.replace('-', '_')}"
     manifest = tmp_path / f"manifest_{source}.json"
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "turkic_translit.cli.train_spm",
+    args = [
         "--langs",
         "kk",  # single language is enough for smoke test
         "--source",
@@ -52,14 +50,13 @@ def test_train_spm_each_source(tmp_path: Path, source: str, max_lines: int) -> N
         str(manifest),
     ]
 
-    try:
-        # Suppress verbose SentencePiece progress to keep CI logs short
-        subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except subprocess.CalledProcessError as exc:
-        # Network hiccup or remote host down → mark as skipped, not failed
-        pytest.skip(f"{source} driver unavailable in this environment: {exc}")
-    except click.ClickException as exc:
-        pytest.skip(f"{source} driver raised ClickException: {exc}")
+    # In-process invocation: no interpreter start-up or re-import per case
+    result = CliRunner().invoke(train_spm_cli, args)
+    if result.exit_code != 0:
+        # ClickException, network hiccup or remote host down → skip, not fail
+        pytest.skip(
+            f"{source} driver unavailable in this environment: {result.exception!r}"
+        )
 
     # ---------- Assertions --------------------------------------------------
     model_path = out_prefix.with_suffix(".model")
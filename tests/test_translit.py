@@ -1,22 +1,104 @@
 import pathlib
+import string
+import types
 import unicodedata
 
-from turkic_translit.core import to_latin
+import pytest
+
+from turkic_translit.core import (
+    _icu_trans,
+    _latin_char_table,
+    _latin_rule_file,
+    _to_latin_cached,
+    get_supported_languages,
+    to_ipa,
+    to_latin,
+)
 
 ROOT = pathlib.Path(__file__).parent
 
 
-def test_roundtrip_and_nfc() -> None:
-    with open(ROOT / "sample_cy.txt", encoding="utf8") as f:
-        src = f.read()
-    out = "\n".join(to_latin(line, "kk") for line in src.splitlines())
+@pytest.fixture(scope="module")
+def sample_cy() -> types.SimpleNamespace:
+    """Read the Kazakh sample and its expected Latin once for this module."""
+    raw = (ROOT / "sample_cy.txt").read_bytes()
+    expected = (ROOT / "expected_lat.txt").read_text(encoding="utf8")
+    return types.SimpleNamespace(
+        bytes=raw,
+        text=raw.decode("utf8"),
+        expected_first=expected.splitlines()[0],
+    )
+
+
+def test_roundtrip_and_nfc(sample_cy: types.SimpleNamespace) -> None:
+    out = "\n".join(to_latin(line, "kk") for line in sample_cy.text.splitlines())
     assert unicodedata.is_normalized("NFC", out)
-    with open(ROOT / "expected_lat.txt", encoding="utf8") as f:
-        exp = f.read()
-    assert out.splitlines()[0] == exp.splitlines()[0]  # quick sanity
+    assert out.splitlines()[0] == sample_cy.expected_first  # quick sanity
+
+
+def test_byte_reduction(sample_cy: types.SimpleNamespace) -> None:
+    out = to_latin(sample_cy.text, "kk").encode("utf8")
+    assert len(out) < len(sample_cy.bytes)
+
+
+_ASCII_SAMPLE = string.printable + " Merhaba dunya, shch zh kh gh ng!"
 
 
-def test_byte_reduction() -> None:
-    src = (ROOT / "sample_cy.txt").read_bytes()
-    out = to_latin(src.decode("utf8"), "kk").encode("utf8")
-    assert len(out) < len(src)
+@pytest.mark.parametrize(
+    "lang",
+    sorted(lang for lang, fmts in get_supported_languages().items() if "latin" in fmts),
+)
+def test_ascii_is_latin_fixed_point(lang: str) -> None:
+    # to_latin returns ASCII input unchanged without running ICU; guard
+    # that shortcut against a rule set that starts rewriting ASCII.
+    for name in (_latin_rule_file(lang), "ar_lat.rules"):
+        assert _icu_trans(name).transliterate(_ASCII_SAMPLE) == _ASCII_SAMPLE
+    assert to_latin(_ASCII_SAMPLE, lang, include_arabic=True) == _ASCII_SAMPLE
+
+
+def test_to_latin_memoizes_non_ascii_input() -> None:
+    _to_latin_cached.cache_clear()
+    first = to_latin("сәлем", "kk")
+    assert to_latin("сәлем", "kk") == first
+    assert _to_latin_cached.cache_info().hits == 1
+    # ASCII input short-circuits before the cache; long input bypasses it
+    to_latin("salem", "kk")
+    to_latin("сәлем " * 300, "kk")
+    assert _to_latin_cached.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("lang", ["kk", "ky", "tr"])
+def test_char_table_matches_icu(lang: str, sample_cy: types.SimpleNamespace) -> None:
+    # The str.translate fast path must agree with the ICU rules it replaces,
+    # and inputs it cannot cover (NFD marks, other scripts) must fall back.
+    rule_file = _latin_rule_file(lang)
+    assert _latin_char_table(rule_file) is not None
+    assert _latin_char_table("ar_lat.rules", rule_file) is not None
+    icu_trans = _icu_trans(rule_file)
+    ar_trans = _icu_trans("ar_lat.rules")
+    samples = [
+        *sample_cy.text.splitlines(),
+        "Қазақстан Республикасы, ЁЖИК ёжик!",
+        "Türkiye'nin başkenti Ankara",
+        "и\u0306 кітап 漢字",
+        "Алматы شەھەر ئۈرۈمچى",
+    ]
+    _to_latin_cached.cache_clear()
+    for text in samples:
+        expected = unicodedata.normalize("NFC", icu_trans.transliterate(text))
+        assert to_latin(text, lang) == expected
+        via_ar = icu_trans.transliterate(ar_trans.transliterate(text))
+        expected = unicodedata.normalize("NFC", via_ar)
+        assert to_latin(text, lang, include_arabic=True) == expected
+
+
+@pytest.mark.parametrize(
+    ("lang", "fmt"),
+    [(lang, fmt) for lang, fmts in get_supported_languages().items() for fmt in fmts],
+)
+def test_output_is_nfc_without_python_normalisation(lang: str, fmt: str) -> None:
+    # NFC now comes from the rule sets' trailing ``:: NFC`` pass; feed NFD
+    # input (composed letters split into base + mark) and check the result.
+    text = unicodedata.normalize("NFD", "Қазақстан йогурт Türkiye ёжик ğüşöçı ЎЁЙ")
+    out = to_latin(text, lang) if fmt == "latin" else to_ipa(text, lang)
+    assert unicodedata.is_normalized("NFC", out)
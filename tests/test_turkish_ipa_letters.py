@@ -84,8 +84,7 @@ def test_turkish_word_examples() -> None:
         "değil": "deːil",
         "soğuk": "soːuk",
     }
-    for tr, ipa in examples.items():
-        assert to_ipa(tr, "tr") == ipa
+    assert {w: to_ipa(w, "tr") for w in examples} == examples
 
 
 def test_turkish_sentences() -> None:
@@ -1,6 +1,5 @@
 import builtins
 import os
-import tempfile
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
@@ -72,6 +71,10 @@ def _panphon_utf8_workaround() -> Iterator[None]:
         builtins.open = real_open
 
 
+# panphon feature values: present, absent, unspecified
+_FEAT_VALS = frozenset({"+", "-", "0"})
+
+
 # 1. Test PyICU transliteration
 def test_icu_transliteration() -> None:
     t = icu.Transliterator.createInstance("Any-Latin; NFC")
@@ -117,13 +120,13 @@ def test_epitran_panphon_ipa() -> None:
         # Each segment should have at least 20 features
         assert len(segment) >= 20, f"Segment {i} has too few features: {len(segment)}"
         # Each segment should be a list of feature values (+/-/0)
-        assert all(val in ["+", "-", "0"] for val in segment), (
+        assert _FEAT_VALS.issuperset(segment), (
             f"Invalid feature values in segment {i}: {segment}"
         )
 
 
 # 3. Test SentencePiece encode/decode round-trip
-def test_sentencepiece_roundtrip() -> None:
+def test_sentencepiece_roundtrip(tmp_path: Path) -> None:
     """
     Test SentencePiece tokenizer model training and round-trip encoding/decoding.
 
@@ -131,51 +134,36 @@ def test_sentencepiece_roundtrip() -> None:
     """
     # Use a mix of Latin, Cyrillic and special chars to test encoding
     samples = ["Ğalamdyq jeli", "Kitap bar", "Ülken söz", "Мысал текст"]
-    model_file = "mini.model"
-    vocab_file = "mini.vocab"
-
-    with tempfile.NamedTemporaryFile("w", encoding="utf8", delete=False) as temp_file:
-        # Write sample text to temporary file
-        for sample in samples:
-            temp_file.write(f"{sample}\n")
-        temp_path = temp_file.name
+    corpus = tmp_path / "mini.txt"
+    corpus.write_text("".join(f"{sample}\n" for sample in samples), encoding="utf8")
+    model_file = str(tmp_path / "mini.model")
+
+    # Train with the exact vocab size needed for this corpus (33)
+    # This value was determined from the error message
+    spm.SentencePieceTrainer.train(
+        input=str(corpus),
+        model_prefix=str(tmp_path / "mini"),
+        vocab_size=33,  # Exactly what SentencePiece can handle with this corpus
+        model_type="unigram",
+        character_coverage=0.9995,
+    )
 
+    # Test encoding and decoding
     try:
-        # Train with the exact vocab size needed for this corpus (33)
-        # This value was determined from the error message
-        spm.SentencePieceTrainer.train(
-            input=temp_path,
-            model_prefix="mini",
-            vocab_size=33,  # Exactly what SentencePiece can handle with this corpus
-            model_type="unigram",
-            character_coverage=0.9995,
-        )
+        # Try newer SentencePiece API
+        proc = spm.SentencePieceProcessor()
+        proc.load(model_file)
+    except (TypeError, AttributeError):
+        # Fallback for older versions
+        proc = spm.SentencePieceProcessor(model_file=model_file)
 
-        # Test encoding and decoding
-        sample = samples[0]
-        try:
-            # Try newer SentencePiece API
-            proc = spm.SentencePieceProcessor()
-            proc.load(model_file)
-        except (TypeError, AttributeError):
-            # Fallback for older versions
-            proc = spm.SentencePieceProcessor(model_file=model_file)
-
-        ids = proc.encode(sample, out_type=int)
-        decoded = proc.decode(ids)
+    # One native call for the whole batch, as production encoding does
+    ids_batch = proc.encode(samples, out_type=int)
+    decoded_batch = proc.decode(ids_batch)
 
-        # Verify results
-        assert isinstance(ids, list)
-        assert decoded == sample
-
-    finally:
-        # Clean up files
-        if os.path.exists(temp_file.name):
-            os.unlink(temp_file.name)
-        if os.path.exists(model_file):
-            os.unlink(model_file)
-        if os.path.exists(vocab_file):
-            os.unlink(vocab_file)
+    # Verify results
+    assert all(isinstance(ids, list) for ids in ids_batch)
+    assert decoded_batch == samples
 
 
 # 4. Test fastText LID logic
@@ -213,8 +201,9 @@ def test_fasttext_lid() -> None:
             # fasttext-wheel has different API
             lid = fasttext.FastText.load_model(lid_path)
 
-        # Test on a simple Russian word
-        prediction = lid.predict("Пример", k=1)
+        # Predict a small batch in one call; the Russian word leads it
+        samples = ["Пример", "Hello world", "Merhaba dünya"]
+        prediction = lid.predict(samples, k=1)
 
         # Handle different return formats
         if isinstance(prediction, tuple):
@@ -224,8 +213,9 @@ def test_fasttext_lid() -> None:
             lbl = prediction[0]
             conf = prediction[1]
 
-        assert lbl[0] == "__label__ru"
-        assert conf[0] > 0.5
+        assert len(lbl) == len(samples)
+        assert lbl[0][0] == "__label__ru"
+        assert conf[0][0] > 0.5
     except Exception as e:
         pytest.skip(
             f"fastText test failed: {e}\nThis might be due to environment differences."
@@ -233,7 +223,7 @@ def test_fasttext_lid() -> None:
 
 
 # 5. Test SentencePiece training in web interface
-def test_web_sentencepiece_training() -> None:
+def test_web_sentencepiece_training(tmp_path: Path) -> None:
     """
     Test the SentencePiece training functionality used in the web interface.
 
@@ -249,10 +239,11 @@ def test_web_sentencepiece_training() -> None:
 кыргыз тилинде сүйлөйм"""
 
     # Create a test file for training
-    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as test_file:
-        # Different content for the file to verify both are used
-        test_file.write("тестовый текст\nбіз қазақша сөйлейміз\nкыргызча сүйлөйбүз")
-        test_path = test_file.name
+    # Different content for the file to verify both are used
+    test_path = tmp_path / "training.txt"
+    test_path.write_text(
+        "тестовый текст\nбіз қазақша сөйлейміз\nкыргызча сүйлөйбүз", encoding="utf-8"
+    )
 
     # Convert to an object similar to what Gradio provides
     class MockFileObject:
@@ -261,7 +252,7 @@ def test_web_sentencepiece_training() -> None:
         def __init__(self, path: str) -> None:
             self.name = path
 
-    test_file_obj = MockFileObject(test_path)
+    test_file_obj = MockFileObject(str(test_path))
 
     try:
         # Train using both text content and file upload
@@ -309,12 +300,8 @@ def test_web_sentencepiece_training() -> None:
         assert "bpe" in info2
 
     finally:
-        # Clean up
-        if os.path.exists(test_path):
-            os.unlink(test_path)
-
-        # Clean up model files
-        if "model_path" in locals() and os.path.exists(model_path):
-            os.unlink(model_path)
-        if "model_path2" in locals() and os.path.exists(model_path2):
-            os.unlink(model_path2)
+        # The trained models are written to the system temp dir, not tmp_path
+        if "model_path" in locals():
+            Path(model_path).unlink(missing_ok=True)
+        if "model_path2" in locals():
+            Path(model_path2).unlink(missing_ok=True)
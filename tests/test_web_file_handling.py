@@ -1,10 +1,13 @@
 """Test file upload/download functionality in the web interface."""
 
+import typing as t
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from turkic_translit import core
+from turkic_translit.web import web_utils
 from turkic_translit.web.web_utils import _CRON_DIR, direct_transliterate
 
 
@@ -76,6 +79,122 @@ def test_direct_transliterate_function() -> None:
     # Note: empty input returns empty result with stats showing 0 bytes
 
 
+def test_direct_transliterate_memoizes_short_inputs() -> None:
+    """Repeated short inputs hit the core to_ipa cache; long ones bypass it."""
+    core._to_ipa_cached.cache_clear()
+    first = direct_transliterate("Merhaba dünya", "tr", False, "ipa")
+    second = direct_transliterate("Merhaba dünya", "tr", False, "IPA")
+    assert first == second
+    assert core._to_ipa_cached.cache_info().hits == 1
+
+    long_text = "merhaba " * (core._TRANSLIT_CACHE_MAX_TEXT // 8 + 1)
+    direct_transliterate(long_text, "tr", False, "ipa")
+    assert core._to_ipa_cached.cache_info().currsize == 1
+
+
+def test_token_table_markdown_renders_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Token table is plain markdown with pipes in tokens escaped."""
+    pipeline = Mock()
+    pipeline.tokenizer.tokenize.return_value = ["▁сәлем", "a|b"]
+    pipeline.langid.predict_tokens.return_value = ["kk", "en"]
+    monkeypatch.setattr(web_utils, "_lazy_pipeline", lambda: pipeline)
+
+    table = web_utils.token_table_markdown("сәлем a|b")
+
+    assert table.splitlines() == [
+        "| Token | Lang |",
+        "|---|---|",
+        "| ▁сәлем | kk |",
+        "| a\\|b | en |",
+    ]
+
+
+def test_pipeline_transliterate_does_not_mutate_shared_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The mode travels with the call instead of being set on the singleton."""
+    pipeline = Mock()
+    pipeline.mode = "latin"
+    pipeline.process.return_value = "salem"
+    monkeypatch.setattr(web_utils, "_lazy_pipeline", lambda: pipeline)
+    web_utils._cached_pipeline.cache_clear()
+
+    result, _ = web_utils.pipeline_transliterate("сәлем", "IPA")
+
+    assert result == "salem"
+    pipeline.process.assert_called_once_with("сәлем", mode="ipa")
+    assert pipeline.mode == "latin"
+
+
+def test_prewarm_loads_models_and_tolerates_missing_tokenizer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """prewarm() touches both lazy singletons; a missing SPM model is not fatal."""
+    get_langid = Mock()
+
+    def _no_tokenizer() -> None:
+        raise OSError("turkic_model.model not found")
+
+    monkeypatch.setattr(web_utils, "get_langid", get_langid)
+    monkeypatch.setattr(web_utils, "_lazy_pipeline", _no_tokenizer)
+
+    web_utils.prewarm()
+
+    get_langid.assert_called_once_with()
+
+
+def test_pipeline_reuses_shared_langid(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The web pipeline shares mask_russian's LangID instead of loading another."""
+    from turkic_translit import pipeline as pipeline_mod
+
+    shared = Mock()
+    monkeypatch.setattr(pipeline_mod, "TurkicTokenizer", Mock())
+    monkeypatch.setattr(
+        pipeline_mod, "FastTextLangID", Mock(side_effect=AssertionError("reloaded"))
+    )
+    monkeypatch.setattr(web_utils, "get_langid", lambda: shared)
+
+    assert web_utils._make_pipeline().langid is shared
+
+
+def test_singleton_builders_are_module_level_functions() -> None:
+    """Builders take no arguments, so a cache cannot pin per-instance copies."""
+    import inspect
+
+    for builder in (web_utils._make_pipeline, web_utils.get_langid):
+        assert not inspect.signature(builder).parameters, builder.__name__
+
+
+def test_lazy_pipeline_builds_once_under_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent first calls share a single pipeline construction."""
+    import threading
+    import time
+
+    built: list[object] = []
+
+    def _slow_make() -> object:
+        time.sleep(0.05)
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(web_utils, "_PIPELINE", None)
+    monkeypatch.setattr(web_utils, "_make_pipeline", _slow_make)
+    results: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(web_utils._lazy_pipeline()))
+        for _ in range(8)
+    ]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert len(built) == 1
+    assert all(r is built[0] for r in results)
+
+
 @pytest.mark.parametrize(
     ("text", "lang", "fmt", "expected"),
     [
@@ -102,3 +221,21 @@ def test_file_size_threshold() -> None:
     # Large result (> 50 chars) - should enable download
     large_text = "This is a longer text that exceeds the threshold for enabling download functionality"
     assert len(large_text) > 50
+
+
+def test_pasted_training_text_strips_crlf(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pasted CRLF text reaches SentencePiece without trailing carriage returns."""
+    spm = pytest.importorskip("sentencepiece")
+    seen: list[str] = []
+
+    class _StopTrainingError(Exception):
+        pass
+
+    def _train(**kwargs: t.Any) -> None:
+        seen.extend(kwargs["sentence_iterator"])
+        raise _StopTrainingError
+
+    monkeypatch.setattr(spm.SentencePieceTrainer, "train", _train)
+    with pytest.raises(_StopTrainingError):
+        web_utils.train_sentencepiece_model("сәлем әлем\r\nмектеп\r\n\r\nкітап")
+    assert seen == ["сәлем әлем", "мектеп", "", "кітап"]
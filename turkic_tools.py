@@ -7,7 +7,7 @@ and utility tools for the Turkic Transliteration Suite.
 """
 
 import pathlib
-import subprocess
+import runpy
 import sys
 from typing import Any
 
@@ -52,18 +52,37 @@ def run_web_ui() -> int:
         return 1
 
 
+def _run_demo(demo_path: pathlib.Path) -> int:
+    """Execute *demo_path* as ``__main__`` in this interpreter.
+
+    Running in-process reuses the already-imported packages instead of
+    paying a fresh interpreter start-up; ``sys.exit`` codes are honoured.
+    """
+    if not demo_path.exists():
+        print(f"Demo script not found: {demo_path}")
+        return 1
+    try:
+        runpy.run_path(str(demo_path), run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code)
+        return 1
+    return 0
+
+
 def run_simple_demo() -> int:
     """Run the simple CLI demo."""
     demo_path = PROJECT_ROOT / "examples" / "simple_demo.py"
     print(f"Running simple demo from {demo_path}...")
-    return subprocess.call([sys.executable, str(demo_path)])
+    return _run_demo(demo_path)
 
 
 def run_full_demo() -> int:
     """Run the comprehensive CLI demo with multiple languages."""
     demo_path = PROJECT_ROOT / "examples" / "demo_translit.py"
     print(f"Running full demo from {demo_path}...")
-    return subprocess.call([sys.executable, str(demo_path)])
+    return _run_demo(demo_path)
 
 
 def show_help() -> int: